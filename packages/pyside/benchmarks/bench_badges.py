@@ -0,0 +1,115 @@
+"""Construction time and memory for 10k RwBadge widgets.
+
+Compares the previous per-instance ``setStyleSheet`` approach (``local``),
+the shared application sheet (``shared``) and the same inside
+``rosewood.batch()`` (``batch``, via ``RwBadge.create_many``). Badges are
+added to an already visible window. Each mode runs in a fresh subprocess
+so RSS numbers are not polluted by the other runs.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_badges.py [-n 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+VARIANTS = ("default", "accent", "success", "danger", "warning", "info")
+
+
+def _rss_kb() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def _local_sheet(badge, variant: str) -> None:
+    """The pre-registry styling: one formatted stylesheet per instance."""
+    from rosewood.colors import RADIUS, DarkColors
+
+    c = DarkColors
+    colors_map = {
+        "default": (c.surface, c.text_secondary, c.border_light),
+        "accent": (c.accent_bg, c.accent_text, c.accent_light),
+        "success": (c.success_bg, c.success, "transparent"),
+        "danger": (c.danger_bg, c.danger, "transparent"),
+        "warning": (c.warning_bg, c.warning, "transparent"),
+        "info": (c.info_bg, c.info, "transparent"),
+    }
+    bg, fg, border = colors_map[variant]
+    badge.setStyleSheet(f"""
+        RwBadge {{
+            background: {bg};
+            color: {fg};
+            border: 1px solid {border};
+            border-radius: {RADIUS.full}px;
+            padding: 4px 12px;
+            font-size: 12px;
+            font-weight: 600;
+        }}
+    """)
+
+
+def run(mode: str, count: int) -> None:
+    from PySide6.QtWidgets import QApplication, QVBoxLayout, QWidget
+
+    from rosewood import RwBadge, apply_theme
+
+    app = QApplication.instance() or QApplication([])
+    apply_theme(app)
+    host = QWidget()
+    layout = QVBoxLayout(host)
+    host.show()
+    app.processEvents()
+
+    rss_before = _rss_kb()
+    start = time.perf_counter()
+    if mode == "batch":
+        per_variant = -(-count // len(VARIANTS))
+        for k, variant in enumerate(VARIANTS):
+            first, last = k * per_variant, min(count, (k + 1) * per_variant)
+            texts = (f"Badge {i}" for i in range(first, last))
+            RwBadge.create_many(texts, variant=variant, parent=host)
+    else:
+        for i in range(count):
+            variant = VARIANTS[i % len(VARIANTS)]
+            badge = RwBadge(f"Badge {i}", variant=variant)
+            if mode == "local":
+                _local_sheet(badge, variant)
+            layout.addWidget(badge)
+    built = time.perf_counter()
+    app.processEvents()  # polish + first layout
+    done = time.perf_counter()
+
+    print(
+        f"{mode:>6}: {count} badges  "
+        f"construct {(built - start) * 1e3:8.1f} ms  "
+        f"polish+layout {(done - built) * 1e3:8.1f} ms  "
+        f"per-widget {(done - start) / count * 1e6:6.1f} us  "
+        f"rss +{(_rss_kb() - rss_before) / 1024:6.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--count", type=int, default=10_000)
+    parser.add_argument("--mode", choices=("local", "shared", "batch"))
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.count)
+        return
+
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    for mode in ("local", "shared", "batch"):
+        subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "-n", str(args.count)],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Paint throughput of a 100k-row table under the qss and palette engines.
+
+Scrolls a QTableView over a QStandardItemModel page by page, forcing a
+synchronous repaint each step. The model is C++-backed so Python
+``data()`` calls do not drown out styling cost. Each engine runs in its
+own subprocess.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_engines.py [-n 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def run(engine: str, rows: int, pages: int) -> None:
+    from PySide6.QtGui import QStandardItemModel
+    from PySide6.QtWidgets import QApplication, QTableView
+
+    from rosewood import Theme
+
+    app = QApplication.instance() or QApplication([])
+    Theme().apply(app, engine=engine)
+
+    model = QStandardItemModel(rows, 4)
+    for row in range(rows):
+        for column in range(4):
+            model.setData(model.index(row, column), f"{row}:{column}")
+
+    view = QTableView()
+    view.setModel(model)
+    view.verticalHeader().setDefaultSectionSize(32)
+    view.resize(900, 700)
+    view.show()
+    app.processEvents()
+
+    bar = view.verticalScrollBar()
+    step = max(1, bar.maximum() // pages)
+    start = time.perf_counter()
+    for page in range(pages):
+        bar.setValue(page * step)
+        view.viewport().repaint()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{engine:>8}: {rows} rows  {pages} frames in {elapsed * 1e3:8.1f} ms  "
+        f"{elapsed / pages * 1e3:6.2f} ms/frame  {pages / elapsed:7.1f} fps"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--engine", choices=("qss", "palette"))
+    args = parser.parse_args()
+
+    if args.engine:
+        run(args.engine, args.rows, args.pages)
+        return
+
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    for engine in ("qss", "palette"):
+        subprocess.run(
+            [
+                sys.executable, __file__,
+                "--engine", engine,
+                "-n", str(args.rows),
+                "--pages", str(args.pages),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Import-time budget for the headless parts of rosewood.
+
+Runs ``python -X importtime`` in a fresh interpreter for each target,
+sums the cumulative time of the top-level imports, and fails if a target
+exceeds its budget or loads any Qt module.
+
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Cumulative microseconds (best of --repeat). Generous enough for slow CI
+# machines, tight enough that eagerly importing PySide6 blows through it.
+BUDGETS_US = {
+    "import rosewood": 10_000,
+    "import rosewood.colors": 50_000,
+    "from rosewood import Theme; Theme().generate_qss()": 100_000,
+}
+
+
+def measure(statement: str) -> tuple[int, list[str]]:
+    """Return (cumulative us of top-level rosewood imports, all imported modules)."""
+    env = {**os.environ, "ROSEWOOD_CACHE_DIR": ""}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total = 0
+    modules = []
+    in_statement = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        # Nested imports are indented under their parent, so top-level
+        # entries partition the run. Everything after interpreter start-up
+        # (which ends with ``site``) is caused by the statement.
+        is_top_level = len(name) - len(name.lstrip()) == 1
+        if in_statement:
+            modules.append(module)
+            if is_top_level:
+                total += int(cumulative)
+        elif is_top_level and module == "site":
+            in_statement = True
+    return total, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for statement, budget in BUDGETS_US.items():
+        runs = [measure(statement) for _ in range(args.repeat)]
+        best = min(total for total, _ in runs)
+        qt = sorted({m for m in runs[0][1] if m.startswith(("PySide6", "shiboken6"))})
+        ok = best <= budget and not qt
+        failed |= not ok
+        status = "ok " if ok else "FAIL"
+        print(f"{status} {best / 1000:7.2f} ms (budget {budget / 1000:.0f} ms)  {statement}")
+        if qt:
+            print(f"     loaded Qt modules: {', '.join(qt)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Frame time of a scrolled grid of elevated cards: cached shadow vs effect.
+
+``cached`` is the current ``RwCard("elevated")`` (shadow and surface in one
+cached pixmap from ``rosewood.shadow``). ``effect`` reproduces the previous
+implementation: the sheet paints the surface and a
+``QGraphicsDropShadowEffect`` per card adds the shadow. Each mode runs in its own
+subprocess.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_shadows.py [-n 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def run(mode: str, cards: int, frames: int, rounds: int) -> None:
+    from PySide6.QtWidgets import (
+        QApplication,
+        QGraphicsDropShadowEffect,
+        QGridLayout,
+        QLabel,
+        QScrollArea,
+        QVBoxLayout,
+        QWidget,
+    )
+
+    from rosewood import Theme
+    from rosewood.colors import CARD_SHADOW
+    from rosewood.widgets import RwCard
+
+    app = QApplication.instance() or QApplication([])
+    theme = Theme()
+    theme.apply(app)
+    if mode == "effect":
+        # The elevated rule before the painted shadow (the sheet paints the
+        # surface), with the same margin so both modes show the same box
+        rule = (
+            f'RwCard[variant="effect"] {{ background: {theme.colors.surface_elevated}; '
+            f"border: none; margin: {CARD_SHADOW.qss_margin}; }}"
+        )
+        app.setStyleSheet(app.styleSheet() + rule)
+    baseline = rss_mb()
+
+    grid = QWidget()
+    layout = QGridLayout(grid)
+    values = []
+    for i in range(cards):
+        if mode == "effect":
+            card = RwCard()
+            card.setProperty("variant", "effect")
+            shadow = QGraphicsDropShadowEffect()
+            shadow.setBlurRadius(20)
+            shadow.setOffset(0, 4)
+            shadow.setColor(theme.palette.color("shadow"))
+            card.setGraphicsEffect(shadow)
+        else:
+            card = RwCard("elevated")
+        content = QVBoxLayout(card)
+        content.addWidget(QLabel(f"Card {i}"))
+        value = QLabel("0")
+        content.addWidget(value)
+        values.append(value)
+        card.setFixedSize(220, 140)
+        layout.addWidget(card, i // 4, i % 4)
+
+    area = QScrollArea()
+    area.setWidget(grid)
+    area.resize(1000, 800)
+    area.show()
+    app.processEvents()
+
+    # Full repaints while scrolling through the whole grid
+    bar = area.verticalScrollBar()
+    step = max(1, bar.maximum() // frames)
+
+    def scroll_round() -> float:
+        start = time.perf_counter()
+        for frame in range(frames):
+            bar.setValue((frame * step) % (bar.maximum() + 1))
+            area.viewport().repaint()
+        return (time.perf_counter() - start) / frames
+
+    # Live content: one label per visible card changes each frame
+    def live_round() -> float:
+        bar.setValue(0)
+        app.processEvents()
+        start = time.perf_counter()
+        for frame in range(frames):
+            for value in values[:20]:
+                value.setText(str(frame))
+            app.processEvents()
+        return (time.perf_counter() - start) / frames
+
+    # Best of several rounds, to keep scheduler noise out
+    scroll = min(scroll_round() for _ in range(rounds))
+    live = min(live_round() for _ in range(rounds))
+
+    print(
+        f"{mode:>7}: {cards} cards  scroll {scroll * 1e3:6.2f} ms/frame  "
+        f"live {live * 1e3:6.2f} ms/frame  +{rss_mb() - baseline:6.1f} MB RSS"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--cards", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--mode", choices=("effect", "cached"))
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.cards, args.frames, args.rounds)
+        return
+
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    for mode in ("effect", "cached"):
+        subprocess.run(
+            [
+                sys.executable, __file__,
+                "--mode", mode,
+                "-n", str(args.cards),
+                "--frames", str(args.frames),
+                "--rounds", str(args.rounds),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Notification storm: one animated card per message vs the pooled RwToast.
+
+``naive`` creates an ``RwCard`` per notification, stacks it in a layout
+over the window and runs a ``QPropertyAnimation`` for it, as a direct port
+of the React ``ToastProvider`` would. ``pooled`` sends the same messages
+through ``RwToast``. A 5 ms probe timer measures how long the event loop
+is blocked. Each mode runs in its own subprocess.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_toast.py [--rate 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+MESSAGES = [f"Node {i} unreachable" for i in range(40)]
+VARIANTS = ("danger", "warning", "default")
+
+
+def run(mode: str, rate: int, seconds: float) -> None:
+    from PySide6.QtCore import QEasingCurve, QPoint, QPropertyAnimation, QTimer
+    from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
+
+    from rosewood import RwCard, RwLabel, Theme
+    from rosewood.toast import RwToast
+
+    app = QApplication.instance() or QApplication([])
+    Theme().apply(app)
+    window = QMainWindow()
+    window.resize(900, 700)
+    window.show()
+    random.seed(1)
+
+    if mode == "naive":
+        stack = QWidget(window)
+        stack.setGeometry(480, 0, 420, 700)
+        layout = QVBoxLayout(stack)
+        layout.addStretch()
+        stack.show()
+        cards = []
+
+        def notify(message: str, variant: str) -> None:
+            card = RwCard("elevated", stack)
+            RwLabel(f"{variant}: {message}", parent=card)
+            layout.addWidget(card)
+            animation = QPropertyAnimation(card, b"pos", card)
+            animation.setStartValue(QPoint(420, 0))
+            animation.setEndValue(QPoint(0, 0))
+            animation.setEasingCurve(QEasingCurve.OutCubic)
+            animation.setDuration(180)
+            animation.start()
+            cards.append(card)
+            QTimer.singleShot(4000, card.deleteLater)
+
+        def created() -> int:
+            return len(cards)
+    else:
+        toasts = RwToast(window)
+        notify = toasts.show
+
+        def created() -> int:
+            return toasts.pool_size
+
+    per_tick = max(1, rate // 100)
+    sent = 0
+    busy = 0.0
+
+    def burst() -> None:
+        nonlocal sent, busy
+        start = time.perf_counter()
+        for _ in range(per_tick):
+            notify(random.choice(MESSAGES), random.choice(VARIANTS))
+        busy += time.perf_counter() - start
+        sent += per_tick
+
+    gaps: list[float] = []
+    last = time.perf_counter()
+
+    def probe() -> None:
+        nonlocal last
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+    probe_timer = QTimer()
+    probe_timer.timeout.connect(probe)
+    probe_timer.start(5)
+    storm = QTimer()
+    storm.timeout.connect(burst)
+    storm.start(10)
+    QTimer.singleShot(round(seconds * 1000), app.quit)
+    app.exec()
+
+    print(
+        f"{mode:>6}: {sent} notifications  {created():5d} cards  "
+        f"notify {busy / sent * 1e6:7.1f} µs each  "
+        f"loop gap p50 {statistics.median(gaps) * 1e3:5.1f} ms  max {max(gaps) * 1e3:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=500, help="notifications per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--mode", choices=("naive", "pooled"))
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.rate, args.seconds)
+        return
+
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    for mode in ("naive", "pooled"):
+        subprocess.run(
+            [
+                sys.executable, __file__,
+                "--mode", mode,
+                "--rate", str(args.rate),
+                "--seconds", str(args.seconds),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Feed of N cards: one RwCard per row in a layout vs a recycled RwVirtualList.
+
+``layout`` is the usual approach (a ``QScrollArea`` over a ``QVBoxLayout``
+with every card constructed up front). ``virtual`` binds the same rows to
+a small pool of cards. Each mode runs in its own subprocess.
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_virtual.py [-n 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def run(mode: str, rows: int, frames: int) -> None:
+    from PySide6.QtCore import QStringListModel
+    from PySide6.QtWidgets import QApplication, QScrollArea, QVBoxLayout, QWidget
+
+    from rosewood import Theme
+    from rosewood.virtual import RwVirtualList, bind_card, card_item
+
+    app = QApplication.instance() or QApplication([])
+    Theme().apply(app)
+    texts = [f"Post {i}: a short line of feed text" for i in range(rows)]
+    baseline = rss_mb()
+
+    start = time.perf_counter()
+    if mode == "layout":
+        view = QScrollArea()
+        view.setWidgetResizable(True)
+        content = QWidget()
+        layout = QVBoxLayout(content)
+        for text in texts:
+            card = card_item(content)
+            card.label.setText(text)
+            card.setFixedHeight(72)
+            layout.addWidget(card)
+        view.setWidget(content)
+        bar = view.verticalScrollBar()
+        surface = view.viewport()
+    else:
+        model = QStringListModel(texts)
+        view = RwVirtualList(card_item, bind_card, item_height=72)
+        view.setModel(model)
+        bar = view.verticalScrollBar()
+        surface = view.viewport()
+    view.resize(600, 900)
+    view.show()
+    app.processEvents()
+    build = time.perf_counter() - start
+
+    step = max(1, bar.maximum() // frames)
+    start = time.perf_counter()
+    for frame in range(frames):
+        bar.setValue((frame * step) % (bar.maximum() + 1))
+        surface.repaint()
+    scroll = (time.perf_counter() - start) / frames
+
+    print(
+        f"{mode:>7}: {rows} rows  build {build * 1e3:8.1f} ms  "
+        f"scroll {scroll * 1e3:6.2f} ms/frame  +{rss_mb() - baseline:6.1f} MB RSS"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--mode", choices=("layout", "virtual"))
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.rows, args.frames)
+        return
+
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    for mode in ("layout", "virtual"):
+        subprocess.run(
+            [
+                sys.executable, __file__,
+                "--mode", mode,
+                "-n", str(args.rows),
+                "--frames", str(args.frames),
+            ],
+            env=env,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Import, stylesheet rendering and theme application."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+from conftest import populate
+
+
+def _purge_rosewood() -> None:
+    for name in [m for m in sys.modules if m == "rosewood" or m.startswith("rosewood.")]:
+        del sys.modules[name]
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_rosewood(benchmark):
+    benchmark.pedantic(
+        importlib.import_module,
+        args=("rosewood",),
+        setup=_purge_rosewood,
+        rounds=50,
+    )
+
+
+@pytest.mark.benchmark(group="import")
+def test_import_theme(benchmark):
+    benchmark.pedantic(
+        importlib.import_module,
+        args=("rosewood.theme",),
+        setup=_purge_rosewood,
+        rounds=50,
+    )
+
+
+@pytest.mark.benchmark(group="generate_qss")
+@pytest.mark.parametrize("mode", ["dark", "light"])
+def test_generate_qss_cold(benchmark, mode):
+    from rosewood.theme import Theme, ThemeMode
+
+    theme = Theme(ThemeMode(mode))
+    benchmark.pedantic(theme.generate_qss, setup=Theme.invalidate_cache, rounds=200)
+
+
+@pytest.mark.benchmark(group="generate_qss")
+def test_generate_qss_pruned_cold(benchmark):
+    from rosewood.theme import Theme
+
+    theme = Theme()
+    include = {"labels", "buttons", "card", "badge"}
+    benchmark.pedantic(
+        theme.generate_qss,
+        kwargs={"include": include},
+        setup=Theme.invalidate_cache,
+        rounds=200,
+    )
+
+
+@pytest.mark.benchmark(group="generate_qss")
+def test_generate_qss_cached(benchmark):
+    from rosewood.theme import Theme
+
+    theme = Theme()
+    theme.generate_qss()
+    benchmark(theme.generate_qss)
+
+
+@pytest.mark.benchmark(group="generate_qss")
+def test_generate_qss_tenants(benchmark):
+    """Cycle through 50 derived palettes after each has been seen once."""
+    from rosewood.theme import Theme
+
+    accents = [f"#{(i * 0x3a5f17) & 0xFFFFFF:06x}" for i in range(1, 51)]
+
+    def cycle():
+        for accent in accents:
+            Theme.from_accent(accent).generate_qss()
+
+    cycle()
+    benchmark(cycle)
+
+
+@pytest.mark.benchmark(group="apply")
+@pytest.mark.parametrize("scoped", [False, True], ids=["full", "scoped"])
+@pytest.mark.parametrize("count", [100, 1000])
+def test_apply(benchmark, window, qapp, count, scoped):
+    from rosewood.theme import Theme
+
+    populate(window, count)
+    theme = Theme()
+
+    def clear():
+        window.setStyleSheet("")
+        qapp.processEvents()
+
+    def apply():
+        theme.apply(window, scoped=scoped)
+        qapp.processEvents()
+
+    benchmark.pedantic(apply, setup=clear, rounds=10)
+
+
+@pytest.mark.benchmark(group="toggle")
+@pytest.mark.parametrize("incremental", [False, True], ids=["apply", "incremental"])
+def test_toggle(benchmark, window, qapp, incremental):
+    from rosewood.theme import Theme
+
+    populate(window, 1000)
+    theme = Theme()
+    theme.apply(window)
+    qapp.processEvents()
+
+    def toggle():
+        if incremental:
+            report = theme.toggle(window, incremental=True)
+            while not report.finished.done():
+                qapp.processEvents()
+        else:
+            theme.toggle()
+            theme.apply(window)
+        qapp.processEvents()
+
+    benchmark.pedantic(toggle, rounds=10)
@@ -0,0 +1,80 @@
+"""Bulk widget construction and card-grid painting."""
+
+from __future__ import annotations
+
+import pytest
+
+COUNT = 500
+
+
+@pytest.fixture(scope="module")
+def themed(qapp):
+    from rosewood import Theme
+
+    Theme().apply(qapp)
+    qapp.processEvents()
+    yield qapp
+    qapp.setStyleSheet("")
+
+
+def _factories():
+    from rosewood import RwBadge, RwButton, RwCard, RwInput, RwLabel
+
+    return {
+        "RwButton": lambda: RwButton("Button", variant="primary"),
+        "RwLabel": lambda: RwLabel("Label", style="secondary"),
+        "RwInput": lambda: RwInput(placeholder="Input"),
+        "RwBadge": lambda: RwBadge("Badge", variant="accent"),
+        "RwCard": lambda: RwCard(),
+        "RwCard-elevated": lambda: RwCard("elevated"),
+    }
+
+
+@pytest.mark.benchmark(group="construct")
+@pytest.mark.parametrize(
+    "kind", ["RwButton", "RwLabel", "RwInput", "RwBadge", "RwCard", "RwCard-elevated"]
+)
+def test_construct(benchmark, themed, kind):
+    """Build, polish and destroy ``COUNT`` widgets of one kind."""
+    make = _factories()[kind]
+
+    def build():
+        widgets = [make() for _ in range(COUNT)]
+        for widget in widgets:
+            widget.ensurePolished()
+        return widgets
+
+    def teardown(widgets):
+        for widget in widgets:
+            widget.deleteLater()
+        themed.processEvents()
+
+    widgets = None
+
+    def run():
+        nonlocal widgets
+        if widgets is not None:
+            teardown(widgets)
+        widgets = build()
+
+    benchmark.pedantic(run, rounds=10)
+    teardown(widgets)
+
+
+@pytest.mark.benchmark(group="paint")
+@pytest.mark.parametrize("variant", ["default", "elevated"])
+def test_card_grid_paint(benchmark, themed, window, variant):
+    """Full repaint of a window holding a 6x8 grid of cards."""
+    from PySide6.QtWidgets import QLabel, QVBoxLayout
+
+    from rosewood import RwCard, batch
+
+    layout = window.layout()
+    with batch(window):
+        for i in range(48):
+            card = RwCard(variant)
+            QVBoxLayout(card).addWidget(QLabel(f"Card {i}"))
+            layout.addWidget(card, i // 8, i % 8)
+    themed.processEvents()
+
+    benchmark(window.repaint)
@@ -0,0 +1,52 @@
+"""Shared fixtures for the headless benchmark suite."""
+
+from __future__ import annotations
+
+import os
+
+# Before anything imports Qt or rosewood.theme (which reads the cache dir).
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["ROSEWOOD_CACHE_DIR"] = ""  # measure rendering, not the disk cache
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+    app.setStyleSheet("")
+
+
+@pytest.fixture
+def window(qapp):
+    """A shown top-level widget with a grid layout, deleted afterwards."""
+    from PySide6.QtWidgets import QGridLayout, QWidget
+
+    host = QWidget()
+    QGridLayout(host)
+    host.resize(1000, 800)
+    host.show()
+    qapp.processEvents()
+    yield host
+    host.close()
+    host.deleteLater()
+    qapp.processEvents()
+
+
+def populate(host, count: int) -> None:
+    """Fill ``host`` with a mix of Rosewood widgets (4 per row)."""
+    from rosewood import RwBadge, RwButton, RwInput, RwLabel, batch
+
+    makers = (
+        lambda i: RwButton(f"Button {i}", variant="primary" if i % 3 else "ghost"),
+        lambda i: RwLabel(f"Label {i}", style="secondary"),
+        lambda i: RwInput(placeholder=f"Input {i}"),
+        lambda i: RwBadge(f"Badge {i}", variant="accent"),
+    )
+    layout = host.layout()
+    with batch(host):
+        for i in range(count):
+            layout.addWidget(makers[i % 4](i), i // 4, i % 4)
@@ -1,19 +1,48 @@
 """🌹 Rosewood UI for PySide6.
 
 A warm, cozy UI library for Qt applications.
+
+Submodules are imported on first attribute access, so ``import rosewood``
+(or ``rosewood.colors`` / ``rosewood.theme``) never loads Qt. Only the
+widgets pull in PySide6.
 """
 
+from __future__ import annotations
+
+import importlib
+
 __version__ = "0.1.0"
 
-from rosewood.theme import Theme, apply_theme
-from rosewood.colors import Colors, DarkColors, LightColors
-from rosewood.widgets import (
-    RwButton,
-    RwCard,
-    RwInput,
-    RwLabel,
-    RwBadge,
-)
+# Same as typing.TYPE_CHECKING without importing typing at start-up.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from rosewood.colors import Colors, DarkColors, LightColors
+    from rosewood.theme import Theme, apply_theme
+    from rosewood.widgets import (
+        RwBadge,
+        RwButton,
+        RwCard,
+        RwInput,
+        RwLabel,
+        batch,
+    )
+
+_LAZY_ATTRS = {
+    "Theme": "rosewood.theme",
+    "apply_theme": "rosewood.theme",
+    "Colors": "rosewood.colors",
+    "DarkColors": "rosewood.colors",
+    "LightColors": "rosewood.colors",
+    "RwButton": "rosewood.widgets",
+    "RwCard": "rosewood.widgets",
+    "RwInput": "rosewood.widgets",
+    "RwLabel": "rosewood.widgets",
+    "RwBadge": "rosewood.widgets",
+    "batch": "rosewood.widgets",
+}
+
+# Submodules reachable as attributes (``rosewood.instrument.enable()``).
+_LAZY_MODULES = frozenset({"diagnostics", "instrument"})
 
 __all__ = [
     "Theme",
@@ -26,4 +55,20 @@ __all__ = [
     "RwInput",
     "RwLabel",
     "RwBadge",
+    "batch",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
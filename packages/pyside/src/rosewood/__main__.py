@@ -0,0 +1,5 @@
+import sys
+
+from rosewood.cli import main
+
+sys.exit(main())
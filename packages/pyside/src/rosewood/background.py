@@ -0,0 +1,78 @@
+"""🌹 Rosewood background work.
+
+One worker thread for Qt-free work (stylesheet rendering) and a queued
+hand-off back to the GUI thread, where anything touching widgets has to
+run.
+
+Usage:
+    def done(qss, error):             # runs on the GUI thread
+        if error is None:
+            window.setStyleSheet(qss)
+
+    run_in_background(theme.generate_qss, done)
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Signal, Slot
+
+_executor: Optional[ThreadPoolExecutor] = None
+_dispatcher: Optional[_Dispatcher] = None
+_lock = threading.Lock()
+
+
+class _Dispatcher(QObject):
+    """Lives in the GUI thread; signals emitted elsewhere arrive queued."""
+
+    call = Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.call.connect(self._run)
+
+    @Slot(object)
+    def _run(self, fn: Callable[[], Any]) -> None:
+        fn()
+
+
+def executor() -> ThreadPoolExecutor:
+    """The shared worker (a single thread, so requests finish in order)."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rosewood")
+        return _executor
+
+
+def run_in_background(
+    work: Callable[[], Any],
+    done: Callable[[Any, Optional[BaseException]], None],
+) -> None:
+    """Run ``work()`` on the worker, then ``done(result, error)`` on the GUI thread.
+
+    Call from the GUI thread (it owns the hand-off object).
+    """
+    global _dispatcher
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() is not app.thread():
+        raise RuntimeError("run_in_background must be called from the GUI thread")
+    if _dispatcher is None:
+        _dispatcher = _Dispatcher()
+
+    dispatcher = _dispatcher
+
+    def job() -> None:
+        try:
+            result = work()
+        except Exception as exc:
+            # ``exc`` is unbound when the except block ends; bind it now
+            error = exc
+            dispatcher.call.emit(lambda error=error: done(None, error))
+        else:
+            dispatcher.call.emit(lambda: done(result, None))
+
+    executor().submit(job)
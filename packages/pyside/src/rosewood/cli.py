@@ -0,0 +1,115 @@
+"""🌹 Rosewood command line tools.
+
+Usage:
+    rosewood prebuild-qss --accent "#4a90d9"        # both modes, default cache dir
+    rosewood prebuild-qss --accent "#4a90d9" --accent "#2e9e6b" --mode dark \
+        --cache-dir /opt/app/qss
+    rosewood build-tokens                  # regenerate tokens.py and prebuilt QSS
+    rosewood build-tokens --check          # fail if they are out of date
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from rosewood.qss_store import QssStore, default_cache_dir
+from rosewood.theme import Theme, ThemeMode
+
+
+def _prebuild_qss(args: argparse.Namespace) -> int:
+    directory = args.cache_dir or default_cache_dir()
+    if directory is None:
+        print("rosewood: no cache directory (ROSEWOOD_CACHE_DIR is empty)", file=sys.stderr)
+        return 1
+
+    store = QssStore(directory)
+    modes = [ThemeMode(args.mode)] if args.mode else list(ThemeMode)
+    for accent in args.accent:
+        for mode in modes:
+            try:
+                theme = Theme.from_accent(accent, mode, args.secondary)
+            except ValueError as exc:
+                print(f"rosewood: {exc}", file=sys.stderr)
+                return 1
+            path = theme.prebuild(store)
+            print(f"{accent} {mode.value}: {path}")
+    return 0
+
+
+def _build_tokens(args: argparse.Namespace) -> int:
+    from rosewood.token_compiler import DEFAULT_CSS, compile_tokens
+
+    css = args.css or DEFAULT_CSS
+    try:
+        stale = compile_tokens(css, check=args.check)
+    except (OSError, ValueError) as exc:
+        print(f"rosewood: {exc}", file=sys.stderr)
+        return 1
+
+    if args.check:
+        for path in stale:
+            print(f"out of date: {path}", file=sys.stderr)
+        if stale:
+            print("rosewood: run `rosewood build-tokens` and commit the result", file=sys.stderr)
+        return 1 if stale else 0
+    for path in stale:
+        print(f"wrote {path}")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="rosewood", description="Rosewood UI tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prebuild = commands.add_parser(
+        "prebuild-qss",
+        help="write pre-rendered stylesheets of accent palettes to the on-disk cache",
+        description=(
+            "Render the stylesheets of Theme.from_accent palettes into the on-disk "
+            "cache. The built-in dark and light sheets ship prebuilt with the package."
+        ),
+    )
+    prebuild.add_argument(
+        "--accent",
+        action="append",
+        required=True,
+        help="accent color of a palette, as for Theme.from_accent (repeatable)",
+    )
+    prebuild.add_argument(
+        "--secondary",
+        help="secondary color shared by the --accent palettes (default: derived)",
+    )
+    prebuild.add_argument(
+        "--mode",
+        choices=[mode.value for mode in ThemeMode],
+        help="only build this mode (default: all)",
+    )
+    prebuild.add_argument(
+        "--cache-dir",
+        help="target directory (default: $ROSEWOOD_CACHE_DIR or $XDG_CACHE_HOME/rosewood)",
+    )
+    prebuild.set_defaults(func=_prebuild_qss)
+
+    build_tokens = commands.add_parser(
+        "build-tokens",
+        help="compile variables.css into rosewood/tokens.py and prebuilt stylesheets",
+    )
+    build_tokens.add_argument(
+        "--css",
+        help="path to variables.css (default: packages/css/src/variables.css in the repo)",
+    )
+    build_tokens.add_argument(
+        "--check",
+        action="store_true",
+        help="write nothing; exit 1 if the generated files are out of date",
+    )
+    build_tokens.set_defaults(func=_build_tokens)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
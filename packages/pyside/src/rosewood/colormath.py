@@ -0,0 +1,161 @@
+"""🌹 Rosewood color math.
+
+OKLCH conversions and the tone rules that turn one accent color into a
+full palette at runtime (per-tenant branding). Conversions take and return
+whole batches of colors, so deriving a palette converts every seed and
+every tone in one call each. Pure Python (no NumPy), Qt-free.
+
+Usage:
+    colors = derive_colors("#4a90d9", "light")     # cached per (accent, mode, secondary)
+    theme = Theme(ThemeMode.LIGHT, colors=colors)  # or Theme.from_accent("#4a90d9", ...)
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import replace
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from rosewood.colors import Colors, DarkColors, LightColors, intern_palette, parse_color
+
+# Derived palettes kept in memory (enough for a few dozen tenants in both modes).
+DERIVED_CACHE_SIZE = 128
+
+RGB = tuple[int, int, int]
+LCH = tuple[float, float, float]
+
+
+def _to_linear(channel: int) -> float:
+    c = channel / 255
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _to_gamma(value: float) -> float:
+    return 12.92 * value if value <= 0.0031308 else 1.055 * value ** (1 / 2.4) - 0.055
+
+
+def _oklab_to_linear(lightness: float, a: float, b: float) -> tuple[float, float, float]:
+    l_ = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m_ = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s_ = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (
+        4.0767416621 * l_ - 3.3077115913 * m_ + 0.2309699292 * s_,
+        -1.2684380046 * l_ + 2.6097574011 * m_ - 0.3413193965 * s_,
+        -0.0041960863 * l_ - 0.7034186147 * m_ + 1.7076147010 * s_,
+    )
+
+
+def srgb_to_oklch(colors: Iterable[RGB]) -> list[LCH]:
+    """sRGB ``(r, g, b)`` 0-255 triples to OKLCH ``(L 0-1, C, hue degrees)``."""
+    result = []
+    for r, g, b in colors:
+        r, g, b = _to_linear(r), _to_linear(g), _to_linear(b)
+        l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+        m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+        s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+        lightness = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+        a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+        b_ = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+        result.append((lightness, math.hypot(a, b_), math.degrees(math.atan2(b_, a)) % 360))
+    return result
+
+
+def oklch_to_srgb(colors: Iterable[LCH]) -> list[RGB]:
+    """OKLCH to sRGB, reducing chroma (keeping lightness and hue) to fit the gamut."""
+    result = []
+    for lightness, chroma, hue in colors:
+        lightness = min(max(lightness, 0.0), 1.0)
+        cos_h, sin_h = math.cos(math.radians(hue)), math.sin(math.radians(hue))
+        rgb = _oklab_to_linear(lightness, chroma * cos_h, chroma * sin_h)
+        if any(v < -1e-6 or v > 1 + 1e-6 for v in rgb):
+            low, high = 0.0, chroma
+            for _ in range(16):
+                mid = (low + high) / 2
+                rgb = _oklab_to_linear(lightness, mid * cos_h, mid * sin_h)
+                if any(v < -1e-6 or v > 1 + 1e-6 for v in rgb):
+                    high = mid
+                else:
+                    low = mid
+            rgb = _oklab_to_linear(lightness, low * cos_h, low * sin_h)
+        result.append(tuple(round(min(max(_to_gamma(v), 0.0), 1.0) * 255) for v in rgb))
+    return result
+
+
+def to_hex(rgb: RGB) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*rgb)
+
+
+def _rgba(rgb: RGB, alpha: float) -> str:
+    return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha:g})"
+
+
+# Solid tones per mode as (lightness, chroma scale, chroma cap), fitted to
+# the hand-tuned built-in palettes. A negative lightness is an offset from
+# the seed's; the hue is always the seed's.
+_DARK_TONES = {"dark": (-0.13, 1.2, None)}
+_LIGHT_TONES = {
+    "dark": (-0.08, 1.05, None),
+    "light": (0.92, 0.35, 0.045),
+    "bg": (0.95, 0.25, 0.03),
+    "text": (0.44, 1.1, None),
+}
+
+
+def _tones(seed: LCH, mode: str) -> dict[str, LCH]:
+    lightness, chroma, hue = seed
+    tones = {}
+    for name, (target, scale, cap) in (_DARK_TONES if mode == "dark" else _LIGHT_TONES).items():
+        c = chroma * scale if cap is None else min(chroma * scale, cap)
+        tones[name] = (lightness + target if target < 0 else target, c, hue)
+    return tones
+
+
+def _seed_rgb(value: str) -> RGB:
+    r, g, b, _ = parse_color(value)
+    return r, g, b
+
+
+def derive_colors(accent: str, mode: str = "dark", secondary: Optional[str] = None) -> Colors:
+    """A palette for ``mode`` ("dark"/"light") built around ``accent``.
+
+    The accent family (and the secondary family when a ``secondary`` seed is
+    given) is derived in OKLCH, so shades keep the seed's hue; backgrounds,
+    text and semantic colors come from the built-in palette of that mode.
+    Results are memoized, so repeated calls for the same seeds return the
+    identical ``Colors`` object (and hit every cache keyed on it).
+    """
+    accent = to_hex(_seed_rgb(accent))
+    if secondary is not None:
+        secondary = to_hex(_seed_rgb(secondary))
+    return _derive_colors(accent, mode, secondary)
+
+
+@lru_cache(maxsize=DERIVED_CACHE_SIZE)
+def _derive_colors(accent: str, mode: str, secondary: Optional[str]) -> Colors:
+    if mode not in ("dark", "light"):
+        raise ValueError(f"Unknown theme mode: {mode!r}")
+    base = DarkColors if mode == "dark" else LightColors
+    families = {"accent": accent}
+    if secondary is not None:
+        families["secondary"] = secondary
+
+    seeds = {name: _seed_rgb(value) for name, value in families.items()}
+    wanted = {
+        f"{family}_{tone}": lch
+        for family, seed in zip(seeds, srgb_to_oklch(seeds.values()))
+        for tone, lch in _tones(seed, mode).items()
+    }
+    solid = dict(zip(wanted, map(to_hex, oklch_to_srgb(wanted.values()))))
+
+    values = dict(solid)
+    for family, value in families.items():
+        values[family] = value
+        values[f"{family}_text"] = solid.get(f"{family}_text", value)
+        if mode == "dark":
+            # Translucent tints over the dark surfaces, like the CSS
+            values[f"{family}_light"] = _rgba(seeds[family], 0.15)
+            values[f"{family}_bg"] = _rgba(seeds[family], 0.08)
+    if mode == "dark":
+        values["glass_border"] = _rgba(seeds["accent"], 0.08)
+    return intern_palette(replace(base, **values))
@@ -1,12 +1,29 @@
 """🌹 Rosewood color tokens.
 
-All colors match the CSS custom properties from @rosewood-ui/css.
+All colors match the CSS custom properties from @rosewood-ui/css. The
+values come from ``rosewood.tokens``, generated from
+``packages/css/src/variables.css`` by ``rosewood build-tokens``; edit the
+CSS, not this file.
+
+Token objects are slotted (no per-instance ``__dict__``) and color values
+are interned, so palettes derived at runtime share their strings.
+``intern_palette`` additionally collapses equal palettes into one object.
 """
 
-from dataclasses import dataclass
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 
+from rosewood import tokens
 
-@dataclass(frozen=True)
+# Distinct palettes kept by intern_palette(); the least recently used is
+# forgotten beyond this (it stays valid, it just is no longer shared).
+PALETTE_REGISTRY_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
 class Colors:
     """Base color scheme interface."""
     
@@ -52,129 +69,112 @@ class Colors:
     # Glass
     glass_bg: str
     glass_border: str
-
-
-# Dark theme (default)
-DarkColors = Colors(
-    # Primary accent - warm pink
-    accent="#e8a8c0",
-    accent_dark="#c0708a",
-    accent_light="rgba(232, 168, 192, 0.15)",
-    accent_bg="rgba(232, 168, 192, 0.08)",
-    accent_text="#e8a8c0",
-    
-    # Secondary - lavender
-    secondary="#b898d0",
-    secondary_dark="#9878b8",
-    secondary_light="rgba(184, 152, 208, 0.15)",
-    secondary_bg="rgba(184, 152, 208, 0.08)",
-    secondary_text="#b898d0",
-    
-    # Backgrounds - warm dark browns
-    bg="#1a1614",
-    surface="#201c1a",
-    surface_hover="#352f2b",
-    surface_elevated="#2a2420",
-    
-    # Borders
-    border="#3a3230",
-    border_light="#2a2420",
-    
-    # Text - warm whites
-    text="#f5f0ec",
-    text_secondary="#a89e98",
-    text_muted="#6e6460",
     
-    # Semantic
-    success="#88c8a8",
-    success_bg="rgba(136, 200, 168, 0.1)",
-    danger="#e87070",
-    danger_bg="rgba(232, 112, 112, 0.1)",
-    warning="#e8c070",
-    warning_bg="rgba(232, 192, 112, 0.1)",
-    info="#70b8e8",
-    info_bg="rgba(112, 184, 232, 0.1)",
+    # Elevation (matches --rw-shadow-md)
+    shadow: str = tokens.DARK_COLORS["shadow"]
     
-    # Glass
-    glass_bg="rgba(32, 28, 26, 0.72)",
-    glass_border="rgba(232, 168, 192, 0.08)",
-)
+    def __post_init__(self) -> None:
+        # Frozen: bypass __setattr__ to swap in the interned strings
+        for name in _COLOR_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
 
 
-# Light theme
-LightColors = Colors(
-    # Primary accent - deeper pink for light bg
-    accent="#d4849c",
-    accent_dark="#c0708a",
-    accent_light="#fce4ec",
-    accent_bg="#fce4ec",
-    accent_text="#8a3a52",
-    
-    # Secondary
-    secondary="#9878b8",
-    secondary_dark="#7a5a9a",
-    secondary_light="#d8c8e8",
-    secondary_bg="#f3e5f5",
-    secondary_text="#5a3878",
-    
-    # Backgrounds - warm cream
-    bg="#fefdfb",
-    surface="#fff9f5",
-    surface_hover="#f0ebe5",
-    surface_elevated="#ffffff",
-    
-    # Borders
-    border="#e8e0dc",
-    border_light="#f0e8e4",
-    
-    # Text
-    text="#1d1d1f",
-    text_secondary="#6e6e73",
-    text_muted="#a1a1a6",
-    
-    # Semantic
-    success="#2ea860",
-    success_bg="rgba(46, 168, 96, 0.1)",
-    danger="#dc3545",
-    danger_bg="rgba(220, 53, 69, 0.1)",
-    warning="#d4a020",
-    warning_bg="rgba(212, 160, 32, 0.1)",
-    info="#2080c0",
-    info_bg="rgba(32, 128, 192, 0.1)",
+_COLOR_FIELDS = tuple(field.name for field in fields(Colors))
+
+_palettes: OrderedDict[Colors, Colors] = OrderedDict()
+_palettes_lock = threading.Lock()
+
+
+def intern_palette(colors: Colors) -> Colors:
+    """The registered palette equal to ``colors``, registering it if new.
     
-    # Glass
-    glass_bg="rgba(255, 255, 255, 0.72)",
-    glass_border="rgba(0, 0, 0, 0.06)",
+    Equal palettes built separately (per tenant, per request) collapse into
+    one object, so holding many themes costs one palette per distinct set
+    of values and identity checks hit every cache keyed on it.
+    """
+    with _palettes_lock:
+        known = _palettes.get(colors)
+        if known is not None:
+            _palettes.move_to_end(colors)
+            return known
+        _palettes[colors] = colors
+        while len(_palettes) > PALETTE_REGISTRY_SIZE:
+            _palettes.popitem(last=False)
+        return colors
+
+
+def registered_palettes() -> int:
+    """Number of distinct palettes currently held by ``intern_palette``."""
+    return len(_palettes)
+
+
+# Dark theme (default): the :root block of variables.css
+DarkColors = intern_palette(Colors(**tokens.DARK_COLORS))
+
+# Light theme: the [data-theme="light"] block
+LightColors = intern_palette(Colors(**tokens.LIGHT_COLORS))
+
+
+_RGBA_RE = re.compile(
+    r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)"
 )
 
 
+def parse_color(value: str) -> tuple[int, int, int, int]:
+    """Parse a color token into an ``(r, g, b, a)`` tuple of 0-255 ints.
+    
+    Accepts ``#rgb``, ``#rrggbb``, ``#rrggbbaa`` and CSS ``rgb()``/``rgba()``
+    with a 0-1 alpha, which ``QColor`` cannot parse on its own.
+    """
+    value = value.strip()
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(ch * 2 for ch in digits)
+        if len(digits) in (6, 8):
+            r, g, b = (int(digits[i:i + 2], 16) for i in (0, 2, 4))
+            a = int(digits[6:8], 16) if len(digits) == 8 else 255
+            return r, g, b, a
+    else:
+        match = _RGBA_RE.fullmatch(value)
+        if match:
+            r, g, b = (min(int(match.group(i)), 255) for i in (1, 2, 3))
+            alpha = match.group(4)
+            a = 255 if alpha is None else round(min(float(alpha), 1.0) * 255)
+            return r, g, b, a
+    if value == "transparent":
+        return 0, 0, 0, 0
+    raise ValueError(f"Unsupported color token: {value!r}")
+
+
 # Spacing tokens (in pixels)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spacing:
-    xs: int = 4
-    sm: int = 8
-    md: int = 16
-    lg: int = 24
-    xl: int = 32
-    xxl: int = 48
-    xxxl: int = 64
+    xs: int = tokens.SPACING["xs"]
+    sm: int = tokens.SPACING["sm"]
+    md: int = tokens.SPACING["md"]
+    lg: int = tokens.SPACING["lg"]
+    xl: int = tokens.SPACING["xl"]
+    xxl: int = tokens.SPACING["xxl"]
+    xxxl: int = tokens.SPACING["xxxl"]
 
 
 # Border radius tokens
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Radius:
-    sm: int = 8
-    md: int = 12
-    lg: int = 16
-    xl: int = 24
-    full: int = 9999
+    sm: int = tokens.RADIUS["sm"]
+    md: int = tokens.RADIUS["md"]
+    lg: int = tokens.RADIUS["lg"]
+    xl: int = tokens.RADIUS["xl"]
+    full: int = tokens.RADIUS["full"]
 
 
-# Typography
-@dataclass(frozen=True)
+# Typography (sizes are Qt-only; the CSS sets them per component)
+@dataclass(frozen=True, slots=True)
 class Typography:
-    font_family: str = "Inter, -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif"
-    font_mono: str = "'SF Mono', 'Fira Code', 'Cascadia Code', monospace"
+    font_family: str = tokens.FONT_FAMILY
+    font_heading: str = tokens.FONT_HEADING
+    font_mono: str = tokens.FONT_MONO
     
     # Font sizes
     size_xs: int = 12
@@ -187,6 +187,42 @@ class Typography:
     size_3xl: int = 30
 
 
+# Drop shadow shapes (painted by ``rosewood.shadow``)
+@dataclass(frozen=True, slots=True)
+class ShadowSpec:
+    """Shape of a drop shadow: box corner radius, blur radius and offset."""
+    
+    radius: int = tokens.RADIUS["lg"]
+    blur: int = 20
+    dx: int = 0
+    dy: int = 4
+    
+    @property
+    def margins(self) -> tuple[int, int, int, int]:
+        """Space (left, top, right, bottom) to reserve around the box so the visible shadow fits."""
+        spread = self.blur // 2
+        return (
+            max(0, spread - self.dx),
+            max(0, spread - self.dy),
+            max(0, spread + self.dx),
+            max(0, spread + self.dy),
+        )
+    
+    @property
+    def qss_margin(self) -> str:
+        """``margins`` as a QSS ``margin`` value (top right bottom left)."""
+        left, top, right, bottom = self.margins
+        return f"{top}px {right}px {bottom}px {left}px"
+    
+    @property
+    def corner(self) -> int:
+        """Logical size of each nine-slice corner (blur pad + radius + falloff)."""
+        return 2 * self.blur + self.radius
+
+
 SPACING = Spacing()
 RADIUS = Radius()
 TYPOGRAPHY = Typography()
+
+# Elevated RwCard shadow (--rw-shadow-md: 0 4px 20px).
+CARD_SHADOW = ShadowSpec()
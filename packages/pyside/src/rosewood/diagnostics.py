@@ -0,0 +1,312 @@
+"""🌹 Rosewood diagnostics.
+
+Object counts for tracking down memory growth in long-running sessions:
+live Rosewood widgets by class and variant, widget-local stylesheets
+(count and UTF-8 size), installed ``QGraphicsEffect``s and theme
+subscribers. A ``Snapshot`` is a plain value, so snapshots taken minutes
+apart can be diffed to see what keeps growing. ``RwInspector`` is a small
+dock that shows the current counts and the change since a baseline.
+
+Nothing is hooked or recorded in the background; every number is
+collected when a snapshot is taken.
+
+Usage:
+    from rosewood import diagnostics
+
+    before = diagnostics.snapshot()
+    ...
+    print(diagnostics.format_diff(diagnostics.diff(before, diagnostics.snapshot())))
+
+    diagnostics.install_inspector(main_window)   # dockable live view
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QApplication,
+    QDockWidget,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMainWindow,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+from shiboken6 import isValid
+
+from rosewood.theme import Theme, widgets_in
+
+REFRESH_MS = 1000
+
+# Widget type -> name of its most derived Rosewood class (None if not one)
+_rosewood_class: dict[type, Optional[str]] = {}
+
+
+class Snapshot(NamedTuple):
+    """Counts at one moment (``taken_at`` is ``time.monotonic()``)."""
+
+    taken_at: float
+    widgets: dict[tuple[str, str], int]   # (Rosewood class, variant) -> live count
+    total_widgets: int
+    stylesheets: int                      # widgets with a non-empty local sheet
+    stylesheet_bytes: int
+    app_stylesheet_bytes: int
+    effects: dict[str, int]               # QGraphicsEffect class -> installed count
+    theme_subscribers: int
+    dead_subscribers: int                 # callbacks bound to deleted widgets
+
+    @property
+    def rosewood_widgets(self) -> int:
+        return sum(self.widgets.values())
+
+
+class SnapshotDiff(NamedTuple):
+    """Changes from one snapshot to a later one (zero entries left out)."""
+
+    seconds: float
+    widgets: dict[tuple[str, str], int]
+    total_widgets: int
+    stylesheets: int
+    stylesheet_bytes: int
+    effects: dict[str, int]
+    theme_subscribers: int
+    dead_subscribers: int
+
+
+def _rosewood_name(cls: type) -> Optional[str]:
+    if cls not in _rosewood_class:
+        _rosewood_class[cls] = next(
+            (base.__name__ for base in cls.__mro__ if base.__module__.startswith("rosewood.")),
+            None,
+        )
+    return _rosewood_class[cls]
+
+
+def variant_of(widget: QWidget) -> str:
+    """The ``variant`` (cards, badges) or ``class`` (buttons, labels) property."""
+    value = widget.property("variant") or widget.property("class")
+    return str(value) if value else "default"
+
+
+def _subscribers() -> tuple[int, int]:
+    live = dead = 0
+    for callback in Theme.subscribers():
+        owner = getattr(callback, "__self__", None)
+        if isinstance(owner, QWidget) and not isValid(owner):
+            dead += 1
+        else:
+            live += 1
+    return live, dead
+
+
+def snapshot(target: Optional[QWidget | QApplication] = None) -> Snapshot:
+    """Count widgets, local stylesheets and effects in ``target`` (default: the app).
+
+    Widgets inside an ``RwInspector`` are not counted.
+    """
+    app = QApplication.instance()
+    if app is None:
+        raise RuntimeError("diagnostics.snapshot() needs a QApplication")
+    inspectors = [w for w in app.allWidgets() if isinstance(w, RwInspector)]
+    widgets: Counter[tuple[str, str]] = Counter()
+    effects: Counter[str] = Counter()
+    total = sheets = sheet_bytes = 0
+
+    for widget in widgets_in(target if target is not None else app):
+        if any(inspector.isAncestorOf(widget) or inspector is widget for inspector in inspectors):
+            continue
+        total += 1
+        name = _rosewood_name(type(widget))
+        if name is not None:
+            widgets[name, variant_of(widget)] += 1
+        sheet = widget.styleSheet()
+        if sheet:
+            sheets += 1
+            sheet_bytes += len(sheet.encode("utf-8"))
+        effect = widget.graphicsEffect()
+        if effect is not None:
+            effects[type(effect).__name__] += 1
+
+    live, dead = _subscribers()
+    return Snapshot(
+        taken_at=time.monotonic(),
+        widgets=dict(sorted(widgets.items())),
+        total_widgets=total,
+        stylesheets=sheets,
+        stylesheet_bytes=sheet_bytes,
+        app_stylesheet_bytes=len(app.styleSheet().encode("utf-8")),
+        effects=dict(sorted(effects.items())),
+        theme_subscribers=live,
+        dead_subscribers=dead,
+    )
+
+
+def _delta(old: dict, new: dict) -> dict:
+    keys = sorted(old.keys() | new.keys())
+    changes = {key: new.get(key, 0) - old.get(key, 0) for key in keys}
+    return {key: change for key, change in changes.items() if change}
+
+
+def diff(old: Snapshot, new: Snapshot) -> SnapshotDiff:
+    """What changed from ``old`` to ``new``."""
+    return SnapshotDiff(
+        seconds=new.taken_at - old.taken_at,
+        widgets=_delta(old.widgets, new.widgets),
+        total_widgets=new.total_widgets - old.total_widgets,
+        stylesheets=new.stylesheets - old.stylesheets,
+        stylesheet_bytes=new.stylesheet_bytes - old.stylesheet_bytes,
+        effects=_delta(old.effects, new.effects),
+        theme_subscribers=new.theme_subscribers - old.theme_subscribers,
+        dead_subscribers=new.dead_subscribers - old.dead_subscribers,
+    )
+
+
+def format_snapshot(snap: Snapshot) -> str:
+    """A plain-text report of ``snap``."""
+    lines = [f"{'Rosewood widget':32} {'variant':12} {'live':>7}"]
+    lines += [f"{cls:32} {variant:12} {count:7}" for (cls, variant), count in snap.widgets.items()]
+    lines += [
+        "",
+        f"widgets            {snap.total_widgets:8} ({snap.rosewood_widgets} Rosewood)",
+        f"local stylesheets  {snap.stylesheets:8} ({snap.stylesheet_bytes:,} bytes)",
+        f"app stylesheet     {snap.app_stylesheet_bytes:8,} bytes",
+        f"graphics effects   {sum(snap.effects.values()):8}",
+    ]
+    lines += [f"  {name:30} {count:7}" for name, count in snap.effects.items()]
+    lines.append(
+        f"theme subscribers  {snap.theme_subscribers:8} "
+        f"({snap.dead_subscribers} on deleted widgets)"
+    )
+    return "\n".join(lines)
+
+
+def format_diff(change: SnapshotDiff) -> str:
+    """A plain-text report of ``change`` (only what changed)."""
+    lines = [f"after {change.seconds:.1f} s:"]
+    lines += [
+        f"  {cls:30} {variant:12} {delta:+7}" for (cls, variant), delta in change.widgets.items()
+    ]
+    totals = (
+        ("widgets", change.total_widgets),
+        ("local stylesheets", change.stylesheets),
+        ("stylesheet bytes", change.stylesheet_bytes),
+        ("theme subscribers", change.theme_subscribers),
+        ("dead subscribers", change.dead_subscribers),
+    )
+    lines += [f"  {name:43} {delta:+7}" for name, delta in totals if delta]
+    lines += [f"  {name:43} {delta:+7}" for name, delta in change.effects.items()]
+    if len(lines) == 1:
+        lines.append("  no change")
+    return "\n".join(lines)
+
+
+class RwInspector(QDockWidget):
+    """Dock showing live ``snapshot()`` counts and the change since a baseline.
+
+    Refreshes every ``refresh_ms`` while visible. "Set baseline" makes the
+    current counts the reference for the delta column.
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        target: Optional[QWidget] = None,
+        refresh_ms: int = REFRESH_MS,
+    ) -> None:
+        super().__init__("Rosewood diagnostics", parent)
+        self.setObjectName("RwInspector")
+        self._target = target
+        self._baseline: Optional[Snapshot] = None
+        self.current: Optional[Snapshot] = None
+
+        body = QWidget(self)
+        layout = QVBoxLayout(body)
+        self._tree = QTreeWidget(body)
+        self._tree.setHeaderLabels(["Name", "Live", "Δ"])
+        self._tree.setRootIsDecorated(False)
+        self._tree.setUniformRowHeights(True)
+        header = self._tree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.setMinimumWidth(360)
+        layout.addWidget(self._tree)
+
+        buttons = QHBoxLayout()
+        self._status = QLabel(body)
+        baseline = QPushButton("Set baseline", body)
+        baseline.clicked.connect(self.set_baseline)
+        buttons.addWidget(self._status, 1)
+        buttons.addWidget(baseline)
+        layout.addLayout(buttons)
+        self.setWidget(body)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_ms)
+        self._timer.timeout.connect(self.refresh)
+
+    def set_baseline(self) -> None:
+        self._baseline = self.refresh()
+
+    def refresh(self) -> Snapshot:
+        snap = snapshot(self._target)
+        if self._baseline is None:
+            self._baseline = snap
+        change = diff(self._baseline, snap)
+        self.current = snap
+
+        rows: list[tuple[str, int, int]] = [
+            (f"{cls} [{variant}]", count, change.widgets.get((cls, variant), 0))
+            for (cls, variant), count in snap.widgets.items()
+        ]
+        rows += [
+            (f"{cls} [{variant}]", 0, delta)
+            for (cls, variant), delta in change.widgets.items()
+            if (cls, variant) not in snap.widgets
+        ]
+        rows += [
+            ("All widgets", snap.total_widgets, change.total_widgets),
+            ("Local stylesheets", snap.stylesheets, change.stylesheets),
+            ("Stylesheet bytes", snap.stylesheet_bytes, change.stylesheet_bytes),
+            ("Theme subscribers", snap.theme_subscribers, change.theme_subscribers),
+            ("Dead subscribers", snap.dead_subscribers, change.dead_subscribers),
+        ]
+        rows += [(name, count, change.effects.get(name, 0)) for name, count in snap.effects.items()]
+
+        self._tree.setUpdatesEnabled(False)
+        self._tree.clear()
+        self._tree.addTopLevelItems([
+            QTreeWidgetItem([name, str(count), f"{delta:+d}" if delta else ""])
+            for name, count, delta in rows
+        ])
+        self._tree.setUpdatesEnabled(True)
+        self._status.setText(f"Δ over {change.seconds:.0f} s")
+        return snap
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._timer.stop()
+
+
+def install_inspector(
+    window: QMainWindow,
+    area: Qt.DockWidgetArea = Qt.RightDockWidgetArea,
+) -> RwInspector:
+    """Dock an ``RwInspector`` counting ``window``'s application widgets."""
+    inspector = RwInspector(window)
+    window.addDockWidget(area, inspector)
+    return inspector
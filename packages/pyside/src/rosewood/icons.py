@@ -0,0 +1,239 @@
+"""🌹 Rosewood themed icons.
+
+Small vector glyphs (SVG templates) colored from ``Colors`` tokens and
+rasterized once per (glyph, color, size, device pixel ratio) into the
+process-wide ``QPixmapCache``. The stylesheet reaches them through
+in-memory Qt resources (``:/rosewood/icons/...``), registered when a theme
+is applied, so Qt decodes each glyph once instead of per widget or paint.
+
+Naming the resources needs no Qt, so ``Theme.generate_qss`` stays
+headless; rendering and registering happen lazily on first use.
+
+Usage:
+    icon = themed_icon("check", theme.colors.accent, 16)   # QIcon
+    pixmap = icon_pixmap("chevron-down", "#6e6460", 12, dpr=2.0)
+    register_qss_icons(theme.colors)   # before applying generate_qss() by hand
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+from rosewood.colors import Colors, parse_color
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QIcon, QImage, QPixmap
+
+RESOURCE_DIR = ":/rosewood/icons"
+
+# Device pixel ratios rendered for the stylesheet; Qt picks name@2x.png on
+# high-DPI screens.
+QSS_DPRS = (1.0, 2.0)
+
+# Registered resource blobs (one per palette); the oldest is unregistered
+# beyond this.
+MAX_RESOURCE_BLOBS = 128
+
+_STROKE = (
+    'fill="none" stroke="{color}" stroke-opacity="{opacity}" stroke-width="{width}" '
+    'stroke-linecap="round" stroke-linejoin="round"'
+)
+
+# 16x16 view box; {color}/{opacity} are filled per token.
+GLYPHS: dict[str, str] = {
+    "chevron-down": f'<path d="M4 6l4 4 4-4" {_STROKE.replace("{width}", "1.75")}/>',
+    "chevron-up": f'<path d="M4 10l4-4 4 4" {_STROKE.replace("{width}", "1.75")}/>',
+    "check": f'<path d="M3.5 8.5l3 3 6-7" {_STROKE.replace("{width}", "2")}/>',
+    "dot": '<circle cx="8" cy="8" r="4" fill="{color}" fill-opacity="{opacity}"/>',
+    "close": f'<path d="M4.5 4.5l7 7M11.5 4.5l-7 7" {_STROKE.replace("{width}", "1.75")}/>',
+}
+
+
+class QssIcon(NamedTuple):
+    glyph: str
+    token: str
+    size: int
+
+
+# Glyphs the stylesheet uses, as template fields ``{i.<name>}``.
+QSS_ICONS: dict[str, QssIcon] = {
+    "combo_arrow": QssIcon("chevron-down", "text_muted", 12),
+    "check": QssIcon("check", "bg", 14),
+    "radio_dot": QssIcon("dot", "bg", 10),
+}
+
+
+def _rgba_hex(color: str) -> str:
+    return "{:02x}{:02x}{:02x}{:02x}".format(*parse_color(color))
+
+
+def icon_name(glyph: str, color: str, size: int) -> str:
+    """Resource file name of a glyph (``@2x`` is inserted for high DPI)."""
+    return f"{glyph}-{_rgba_hex(color)}-{size}.png"
+
+
+class IconUrls:
+    """Template namespace ``i``: resource paths of ``QSS_ICONS`` for a palette."""
+
+    __slots__ = ("_colors",)
+
+    def __init__(self, colors: Colors) -> None:
+        self._colors = colors
+
+    def __getattr__(self, name: str) -> str:
+        glyph, token, size = QSS_ICONS[name]
+        return f"{RESOURCE_DIR}/{icon_name(glyph, getattr(self._colors, token), size)}"
+
+
+def qss_icons(colors: Colors) -> IconUrls:
+    return IconUrls(colors)
+
+
+def svg(glyph: str, color: str) -> bytes:
+    """The SVG document for ``glyph`` in ``color`` (any ``Colors`` token value)."""
+    r, g, b, a = parse_color(color)
+    body = GLYPHS[glyph].format(color=f"#{r:02x}{g:02x}{b:02x}", opacity=f"{a / 255:.3g}")
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 16 16">'
+        f"{body}</svg>"
+    ).encode("utf-8")
+
+
+def _render(glyph: str, color: str, size: int, dpr: float) -> QImage:
+    from PySide6.QtCore import QByteArray, QRectF, Qt
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtSvg import QSvgRenderer
+
+    image = QImage(round(size * dpr), round(size * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    QSvgRenderer(QByteArray(svg(glyph, color))).render(painter, QRectF(0, 0, size, size))
+    painter.end()
+    return image
+
+
+def icon_pixmap(glyph: str, color: str, size: int = 16, dpr: float = 1.0) -> QPixmap:
+    """The cached pixmap of a glyph (``size`` in logical pixels)."""
+    from PySide6.QtGui import QPixmap, QPixmapCache
+
+    key = f"rosewood-icon:{glyph}:{_rgba_hex(color)}:{size}:{dpr:g}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap.fromImage(_render(glyph, color, size, dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def themed_icon(glyph: str, color: str, size: int = 16) -> QIcon:
+    """A ``QIcon`` with 1x and 2x pixmaps from the shared cache."""
+    from PySide6.QtGui import QIcon
+
+    icon = QIcon()
+    for dpr in QSS_DPRS:
+        icon.addPixmap(icon_pixmap(glyph, color, size, dpr))
+    return icon
+
+
+def _qt_hash(name: str) -> int:
+    # qt_hash() from qresource.cpp: children are sorted by it.
+    encoded = name.encode("utf-16-be")
+    h = 0
+    for i in range(0, len(encoded), 2):
+        h = (h << 4) + (encoded[i] << 8 | encoded[i + 1])
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+
+def build_resource(files: dict[str, bytes], prefix: str = RESOURCE_DIR) -> bytes:
+    """Serialize ``{file name: data}`` under ``prefix`` as Qt rcc (format 1) data.
+
+    The result can be passed to ``QResource.registerResourceData``.
+    """
+    dirs = [part for part in prefix.lstrip(":/").split("/") if part]
+    names = bytearray()
+    name_offsets: dict[str, int] = {}
+
+    def name_offset(name: str) -> int:
+        if name not in name_offsets:
+            encoded = name.encode("utf-16-be")
+            name_offsets[name] = len(names)
+            names.extend(struct.pack(">HI", len(encoded) // 2, _qt_hash(name)) + encoded)
+        return name_offsets[name]
+
+    data = bytearray()
+    tree = bytearray()
+    # Root plus one directory per prefix part, each the single child of the last
+    tree += struct.pack(">IHII", 0, 2, 1, 1)
+    for depth, part in enumerate(dirs):
+        last = depth == len(dirs) - 1
+        children = len(files) if last else 1
+        tree += struct.pack(">IHII", name_offset(part), 2, children, depth + 2)
+    for name in sorted(files, key=_qt_hash):
+        # flags 0, QLocale::AnyTerritory, QLocale::C
+        tree += struct.pack(">IHHHI", name_offset(name), 0, 0, 1, len(data))
+        data += struct.pack(">I", len(files[name])) + files[name]
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    header = b"qres" + struct.pack(">IIII", 1, tree_offset, data_offset, names_offset)
+    return header + bytes(tree) + bytes(data) + bytes(names)
+
+
+# file name -> blob id, and blob id -> (resource data kept alive, file names)
+_registered: dict[str, int] = {}
+_blobs: OrderedDict[int, tuple[bytes, tuple[str, ...]]] = OrderedDict()
+_next_blob = 0
+
+
+def _png(image: QImage) -> bytes:
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+
+    buffer = QByteArray()
+    device = QBuffer(buffer)
+    device.open(QIODevice.WriteOnly)
+    image.save(device, "PNG")
+    return bytes(buffer.data())
+
+
+def register_qss_icons(colors: Colors) -> None:
+    """Make the stylesheet glyphs of ``colors`` loadable from ``RESOURCE_DIR``.
+
+    Cheap when the palette was registered before. Called by ``Theme.apply``.
+    """
+    global _next_blob
+    files: dict[str, bytes] = {}
+    for glyph, token, size in QSS_ICONS.values():
+        color = getattr(colors, token)
+        name = icon_name(glyph, color, size)
+        if name in _registered or name in files:
+            continue
+        for dpr in QSS_DPRS:
+            key = name if dpr == 1 else name.replace(".png", f"@{dpr:g}x.png")
+            files[key] = _png(icon_pixmap(glyph, color, size, dpr).toImage())
+    if not files:
+        return
+
+    from PySide6.QtCore import QResource
+
+    blob = build_resource(files)
+    if not QResource.registerResourceData(blob):
+        raise RuntimeError("Qt rejected the Rosewood icon resource data")
+    # Qt reads the registered bytes in place; they must outlive the registration
+    _blobs[_next_blob] = (blob, tuple(files))
+    for name in files:
+        _registered[name] = _next_blob
+    _next_blob += 1
+
+    while len(_blobs) > MAX_RESOURCE_BLOBS:
+        _, (old, old_names) = _blobs.popitem(last=False)
+        QResource.unregisterResourceData(old)
+        for name in old_names:
+            _registered.pop(name, None)
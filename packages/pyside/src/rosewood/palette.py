@@ -0,0 +1,99 @@
+"""🌹 Rosewood packed palettes.
+
+A compact, pre-parsed companion to ``Colors``: every token is stored once
+as a 32-bit ARGB int, and the ``QColor``/``QBrush``/``QPen`` objects built
+from them are cached per palette. Custom ``paintEvent`` code can use
+tokens without parsing strings or allocating per frame.
+
+Usage:
+    palette = theme.palette              # or packed_palette(DarkColors)
+    painter.setPen(palette.pen("border"))
+    painter.fillRect(rect, palette.brush("surface"))
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import fields
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from rosewood.colors import Colors, parse_color
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QBrush, QColor, QPen
+
+# Every palette has the same tokens, so the name -> slot map is shared.
+TOKENS: tuple[str, ...] = tuple(field.name for field in fields(Colors))
+_INDEX = {name: i for i, name in enumerate(TOKENS)}
+
+
+def pack_argb(r: int, g: int, b: int, a: int = 255) -> int:
+    """Pack channels into a ``0xAARRGGBB`` int (Qt's ``QRgb`` layout)."""
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def unpack_argb(argb: int) -> tuple[int, int, int, int]:
+    """Inverse of ``pack_argb``: ``(r, g, b, a)``."""
+    return (argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF, (argb >> 24) & 0xFF
+
+
+class PackedPalette:
+    """``Colors`` tokens as packed ARGB ints with cached Qt paint objects.
+
+    Qt objects are created on first use and then shared, so treat the
+    returned ``QColor``/``QBrush``/``QPen`` as read-only (copy before
+    modifying).
+    """
+
+    __slots__ = ("colors", "_argb", "_qcolors", "_brushes", "_pens")
+
+    def __init__(self, colors: Colors) -> None:
+        self.colors = colors
+        self._argb = array("I", (pack_argb(*parse_color(getattr(colors, n))) for n in TOKENS))
+        self._qcolors: list[QColor | None] = [None] * len(TOKENS)
+        self._brushes: list[QBrush | None] = [None] * len(TOKENS)
+        self._pens: dict[tuple[int, float], QPen] = {}
+
+    def __len__(self) -> int:
+        return len(self._argb)
+
+    def argb(self, name: str) -> int:
+        """Token as a ``0xAARRGGBB`` int."""
+        return self._argb[_INDEX[name]]
+
+    def rgba(self, name: str) -> tuple[int, int, int, int]:
+        return unpack_argb(self.argb(name))
+
+    def color(self, name: str) -> QColor:
+        i = _INDEX[name]
+        color = self._qcolors[i]
+        if color is None:
+            from PySide6.QtGui import QColor
+
+            color = self._qcolors[i] = QColor.fromRgba(self._argb[i])
+        return color
+
+    def brush(self, name: str) -> QBrush:
+        i = _INDEX[name]
+        brush = self._brushes[i]
+        if brush is None:
+            from PySide6.QtGui import QBrush
+
+            brush = self._brushes[i] = QBrush(self.color(name))
+        return brush
+
+    def pen(self, name: str, width: float = 1.0) -> QPen:
+        key = (_INDEX[name], width)
+        pen = self._pens.get(key)
+        if pen is None:
+            from PySide6.QtGui import QPen
+
+            pen = self._pens[key] = QPen(self.color(name), width)
+        return pen
+
+
+@lru_cache(maxsize=128)
+def packed_palette(colors: Colors) -> PackedPalette:
+    """The shared ``PackedPalette`` for a color scheme (built once)."""
+    return PackedPalette(colors)
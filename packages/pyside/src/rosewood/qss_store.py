@@ -0,0 +1,128 @@
+"""🌹 Rosewood on-disk stylesheet store.
+
+Keeps pre-rendered QSS between runs so short-lived processes can skip
+rendering on start-up. Files are keyed by package version, theme mode and
+token hash, and every load is verified against the content hash written
+alongside the stylesheet.
+
+The store lives in ``$ROSEWOOD_CACHE_DIR`` if set, otherwise in
+``$XDG_CACHE_HOME/rosewood`` (``~/.cache/rosewood`` by default). Set
+``ROSEWOOD_CACHE_DIR`` to an empty string to disable it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Optional
+
+_MAGIC = b"/* rosewood-qss sha256="
+_HEADER_END = b" */\n"
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Resolve the cache directory from the environment.
+
+    Returns ``None`` when ``ROSEWOOD_CACHE_DIR`` is set but empty.
+    """
+    override = os.environ.get("ROSEWOOD_CACHE_DIR")
+    if override is not None:
+        return Path(override).expanduser() if override else None
+
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "rosewood"
+
+
+class QssStore:
+    """Directory of pre-rendered stylesheets.
+
+    Usage:
+        store = QssStore("/opt/myapp/qss-cache")
+        store.save("dark", token_hash, qss)
+        qss = store.load("dark", token_hash)  # None if missing or corrupt
+
+    A ``read_only`` store (e.g. stylesheets shipped inside the package)
+    never deletes files that fail verification and refuses to save.
+    """
+
+    def __init__(self, directory: Path | str, read_only: bool = False) -> None:
+        self.directory = Path(directory)
+        self.read_only = read_only
+
+    @classmethod
+    def from_env(cls) -> Optional[QssStore]:
+        """Store at the default location, or ``None`` if disabled."""
+        directory = default_cache_dir()
+        return cls(directory) if directory is not None else None
+
+    def path_for(self, mode: str, token_hash: str) -> Path:
+        from rosewood import __version__
+
+        return self.directory / f"rosewood-{__version__}-{mode}-{token_hash}.qss"
+
+    def load(self, mode: str, token_hash: str) -> Optional[str]:
+        """Read a stylesheet, or return ``None`` if absent or failing its hash."""
+        path = self.path_for(mode, token_hash)
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if m[: len(_MAGIC)] != _MAGIC:
+                    raise ValueError("bad header")
+                header_end = m.find(_HEADER_END, len(_MAGIC))
+                if header_end < 0:
+                    raise ValueError("bad header")
+                expected = m[len(_MAGIC):header_end].decode("ascii")
+                body = m[header_end + len(_HEADER_END):]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Unreadable, empty (mmap refuses zero-length files) or garbled.
+            self._discard(path)
+            return None
+
+        if hashlib.sha256(body).hexdigest() != expected:
+            self._discard(path)
+            return None
+        return body.decode("utf-8")
+
+    def save(self, mode: str, token_hash: str, qss: str) -> Path:
+        """Atomically write a stylesheet with its content hash."""
+        import tempfile  # only needed when writing; keeps start-up imports light
+
+        if self.read_only:
+            raise PermissionError(f"QSS store is read-only: {self.directory}")
+        body = qss.encode("utf-8")
+        header = _MAGIC + hashlib.sha256(body).hexdigest().encode("ascii") + _HEADER_END
+        path = self.path_for(mode, token_hash)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".qss")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(body)
+            os.chmod(tmp, 0o644)  # mkstemp is owner-only; deploy-time caches are shared
+            os.replace(tmp, path)
+        except BaseException:
+            self._discard(Path(tmp))
+            raise
+        return path
+
+    def clear(self) -> None:
+        """Remove every stylesheet in the store."""
+        if self.read_only:
+            raise PermissionError(f"QSS store is read-only: {self.directory}")
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob("rosewood-*.qss"):
+            self._discard(path)
+
+    def _discard(self, path: Path) -> None:
+        if self.read_only:
+            return
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,165 @@
+"""🌹 Rosewood cached drop shadows.
+
+``QGraphicsDropShadowEffect`` re-renders its widget offscreen and blurs it
+again whenever anything inside the widget repaints. Here a shadow is
+blurred once per (corner radius, blur, offset, color, device pixel ratio),
+stored as a nine-slice pixmap in the process-wide ``QPixmapCache``. The
+slices are stretched once per box size into a frame (also cached), so a
+repaint is one unscaled blit. A frame can include the box itself filled
+in the widget's surface color; the widget then paints its whole
+background with that blit.
+
+``ShadowSpec`` and ``CARD_SHADOW`` are defined with the other tokens in
+``rosewood.colors`` (Qt-free), so the stylesheet can reserve their margin.
+
+Usage:
+    spec = ShadowSpec(radius=16, blur=20, dx=0, dy=4)
+    paint_shadow(painter, box_rect, spec, palette.argb("shadow"))
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene
+
+from rosewood.colors import CARD_SHADOW, ShadowSpec
+
+__all__ = ["CARD_SHADOW", "ShadowSpec", "paint_shadow", "shadow_frame", "shadow_pixmap"]
+
+
+def _render_slices(spec: ShadowSpec, argb: int, dpr: float) -> QPixmap:
+    """Blur a minimal rounded box once; its middle row/column is uniform.
+
+    The box that casts the shadow is cleared from the result, so the slices
+    can be painted over the widget's own background without a clip.
+    """
+    pad = spec.blur
+    box = 2 * (spec.radius + spec.blur) + 1
+    side = box + 2 * pad
+    caster = QRectF(pad - spec.dx, pad - spec.dy, box, box)
+
+    source = QPixmap(round(side * dpr), round(side * dpr))
+    source.setDevicePixelRatio(dpr)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor.fromRgba(argb))
+    painter.drawRoundedRect(QRectF(pad, pad, box, box), spec.radius, spec.radius)
+    painter.end()
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(source)
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(spec.blur * dpr)
+    blur.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+
+    image = QImage(source.size(), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, side, side), QRectF(source.rect()))
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setCompositionMode(QPainter.CompositionMode_Clear)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(Qt.black)
+    painter.drawRoundedRect(caster, spec.radius, spec.radius)
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+def shadow_pixmap(spec: ShadowSpec, argb: int, dpr: float = 1.0) -> QPixmap:
+    """The cached nine-slice source pixmap for a shadow."""
+    key = f"rosewood-shadow:{spec.radius}:{spec.blur}:{spec.dx}:{spec.dy}:{argb:08x}:{dpr:g}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _render_slices(spec, argb, dpr)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _assemble(source: QPixmap, spec: ShadowSpec, width: int, height: int, dpr: float) -> QPixmap:
+    """Stretch the nine-slice source around a ``width`` x ``height`` box."""
+    pad = spec.blur
+    c = spec.corner
+    mid = 1  # the uniform middle row/column of the source
+    w, h = width + 2 * pad, height + 2 * pad
+    inner_w, inner_h = max(0, w - 2 * c), max(0, h - 2 * c)
+
+    def src(x: int, y: int, sw: int, sh: int) -> QRectF:
+        return QRectF(x * dpr, y * dpr, sw * dpr, sh * dpr)
+
+    slices = (
+        # corners
+        (QRectF(0, 0, c, c), src(0, 0, c, c)),
+        (QRectF(w - c, 0, c, c), src(c + mid, 0, c, c)),
+        (QRectF(0, h - c, c, c), src(0, c + mid, c, c)),
+        (QRectF(w - c, h - c, c, c), src(c + mid, c + mid, c, c)),
+        # edges
+        (QRectF(c, 0, inner_w, c), src(c, 0, mid, c)),
+        (QRectF(c, h - c, inner_w, c), src(c, c + mid, mid, c)),
+        (QRectF(0, c, c, inner_h), src(0, c, c, mid)),
+        (QRectF(w - c, c, c, inner_h), src(c + mid, c, c, mid)),
+    )
+
+    frame = QPixmap(round(w * dpr), round(h * dpr))
+    frame.setDevicePixelRatio(dpr)
+    frame.fill(Qt.transparent)
+    painter = QPainter(frame)
+    for target, rect in slices:
+        if target.width() > 0 and target.height() > 0:
+            painter.drawPixmap(target, source, rect)
+    painter.end()
+    return frame
+
+
+def shadow_frame(
+    spec: ShadowSpec,
+    argb: int,
+    width: int,
+    height: int,
+    dpr: float = 1.0,
+    fill: Optional[int] = None,
+) -> QPixmap:
+    """The cached shadow for one box size, assembled from ``shadow_pixmap``.
+
+    With ``fill`` the rounded box itself is painted in that color too, so
+    the frame is the whole widget background. Boxes that share a size (a
+    grid of cards) share one frame, so painting is a single unscaled blit.
+    """
+    key = (
+        f"rosewood-shadow:{spec.radius}:{spec.blur}:{spec.dx}:{spec.dy}:{argb:08x}:{dpr:g}"
+        f":{width}x{height}:{'' if fill is None else f'{fill:08x}'}"
+    )
+    frame = QPixmapCache.find(key)
+    if frame is None:
+        frame = _assemble(shadow_pixmap(spec, argb, dpr), spec, width, height, dpr)
+        if fill is not None:
+            painter = QPainter(frame)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor.fromRgba(fill))
+            box = QRectF(spec.blur - spec.dx, spec.blur - spec.dy, width, height)
+            painter.drawRoundedRect(box, spec.radius, spec.radius)
+            painter.end()
+        QPixmapCache.insert(key, frame)
+    return frame
+
+
+def paint_shadow(painter: QPainter, box: QRect, spec: ShadowSpec, argb: int) -> None:
+    """Paint the shadow of ``box`` (the widget's visible rounded rect).
+
+    Nothing is painted inside the box itself, so this can run before or
+    after the widget's own background.
+    """
+    dpr = painter.device().devicePixelRatioF()
+    frame = shadow_frame(spec, argb, box.width(), box.height(), dpr)
+    painter.drawPixmap(box.x() + spec.dx - spec.blur, box.y() + spec.dy - spec.blur, frame)
@@ -5,27 +5,298 @@ Generates Qt stylesheets matching the CSS design system.
 
 from __future__ import annotations
 
+import hashlib
+import re
+import string
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, NamedTuple, Optional
 
 from rosewood.colors import (
+    CARD_SHADOW,
     Colors,
     DarkColors,
     LightColors,
     RADIUS,
     SPACING,
     TYPOGRAPHY,
+    Radius,
+    Spacing,
+    Typography,
+    intern_palette,
 )
+from rosewood.icons import qss_icons, register_qss_icons
+from rosewood.instrument import span, traced
+from rosewood.palette import PackedPalette, packed_palette
+from rosewood.qss_store import QssStore
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from PySide6.QtCore import QVariantAnimation
     from PySide6.QtWidgets import QApplication, QWidget
 
 
+# Stylesheets for the built-in palettes, written by ``rosewood build-tokens``.
+PREBUILT_DIR = Path(__file__).with_name("prebuilt")
+
+# Number of rendered stylesheets kept in memory. One entry per distinct
+# set of tokens, so this covers dark/light for a few dozen tenant palettes
+# (``Theme.from_accent``) at roughly 9 KB each.
+QSS_CACHE_SIZE = 128
+
+
 class ThemeMode(Enum):
     DARK = "dark"
     LIGHT = "light"
 
 
+class CacheInfo(NamedTuple):
+    """Stylesheet cache statistics, as returned by ``Theme.cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompiledTemplate:
+    """A ``str.format``-style template parsed once into literals and lookups.
+
+    Fields must be ``{namespace.attribute}`` references, e.g. ``{c.accent}``.
+    Rendering only resolves the attributes and joins the pieces, so filling
+    in a new palette never re-parses the template text.
+    """
+
+    def __init__(self, source: str) -> None:
+        self._chunks: list[str] = []
+        self._slots: list[tuple[int, str, str, Callable[[object], object]]] = []
+
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                self._chunks.append(literal)
+            if field is None:
+                continue
+            namespace, _, attr = field.partition(".")
+            if not attr or spec or conversion:
+                raise ValueError(f"Unsupported QSS template field: {field!r}")
+            self._slots.append((len(self._chunks), namespace, attr, attrgetter(attr)))
+            self._chunks.append("")
+
+    @property
+    def fields(self) -> list[tuple[str, str]]:
+        """``(namespace, attribute)`` pairs in template order."""
+        return [(namespace, attr) for _, namespace, attr, _ in self._slots]
+
+    def render(self, **namespaces: object) -> str:
+        out = self._chunks.copy()
+        for index, namespace, _, getter in self._slots:
+            out[index] = str(getter(namespaces[namespace]))
+        return "".join(out)
+
+
+class QssCache:
+    """Thread-safe bounded LRU of rendered stylesheets with hit/miss counters."""
+
+    def __init__(self, maxsize: int = QSS_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, render: Callable[[], str]) -> str:
+        with self._lock:
+            qss = self._entries.get(key)
+            if qss is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return qss
+            self.misses += 1
+
+        qss = render()
+
+        with self._lock:
+            self._entries[key] = qss
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return qss
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+@dataclass(frozen=True)
+class ThemeSwitch:
+    """Outcome of ``Theme.toggle(target, incremental=True)``.
+    
+    ``steps`` stylesheets are replaced, one per event-loop tick; the first
+    before ``toggle`` returns (``elapsed_ms``). ``finished`` resolves to the
+    total milliseconds once the last one is applied.
+    """
+    
+    changed_selectors: tuple[str, ...]
+    changed_classes: frozenset[str]
+    steps: int
+    elapsed_ms: float
+    finished: Future[float]
+    
+    @property
+    def restyled(self) -> bool:
+        return bool(self.changed_selectors)
+
+
+_RULE_RE = re.compile(r"([^{}]+?)\s*\{\{(.*?)\}\}", re.S)
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SUBJECT_RE = re.compile(r"([A-Za-z_]\w*)[^\s>]*$")
+
+
+def _compile_rules(source: str) -> tuple[tuple[str, frozenset[tuple[str, str]]], ...]:
+    """Split a QSS template into ``(selector, referenced token fields)`` rules."""
+    rules = []
+    for match in _RULE_RE.finditer(_COMMENT_RE.sub("", source)):
+        selector = " ".join(match.group(1).split())
+        fields = frozenset(CompiledTemplate(match.group(2)).fields)
+        rules.append((selector, fields))
+    return tuple(rules)
+
+
+def selector_classes(selector: str) -> frozenset[str]:
+    """Widget class names a QSS selector list applies to.
+    
+    ``"QComboBox QAbstractItemView"`` -> ``{"QAbstractItemView"}``,
+    ``"QTreeView::item:hover, QListView::item"`` -> ``{"QTreeView", "QListView"}``.
+    """
+    classes = set()
+    for part in selector.split(","):
+        match = _SUBJECT_RE.search(part.strip())
+        if match:
+            classes.add(match.group(1))
+    return frozenset(classes)
+
+
+def _subject_classes(source: str) -> frozenset[str]:
+    """Subject classes of every rule in a QSS template."""
+    classes: set[str] = set()
+    for match in _RULE_RE.finditer(_COMMENT_RE.sub("", source)):
+        classes |= selector_classes(" ".join(match.group(1).split()))
+    return frozenset(classes)
+
+
+class QssSection(NamedTuple):
+    """One per-widget-type block of the stylesheet template."""
+    
+    name: str
+    classes: frozenset[str]
+    source: str
+
+
+# Classes every pruned sheet styles: QWidget carries the global rules and
+# tooltips can be shown for any widget.
+_ALWAYS_PRESENT = frozenset({"QWidget", "QToolTip"})
+
+# Widgets that create their popups only when first opened.
+_IMPLIED_CLASSES = {
+    "QComboBox": frozenset({"QAbstractItemView", "QListView", "QScrollBar"}),
+    "QLineEdit": frozenset({"QMenu"}),
+    "QTextEdit": frozenset({"QMenu"}),
+    "QPlainTextEdit": frozenset({"QMenu"}),
+}
+
+
+def resolve_sections(include: Iterable[str]) -> tuple[str, ...]:
+    """Names of the ``QSS_SECTIONS`` selected by ``include``, in sheet order.
+    
+    Items are section names (``"buttons"``) or Qt class names
+    (``"QPushButton"``). A class selects every section with a rule whose
+    subject is that class, so pass base classes too (``widget_classes``
+    does). The global and tooltip rules are always included.
+    """
+    if isinstance(include, str):
+        include = (include,)
+    names: set[str] = set()
+    present = set(_ALWAYS_PRESENT)
+    for item in include:
+        if item in QSS_SECTIONS:
+            names.add(item)
+        elif item[:1].isupper():
+            present.add(item)
+            present |= _IMPLIED_CLASSES.get(item, frozenset())
+        else:
+            raise ValueError(f"Unknown QSS section: {item!r}")
+    return tuple(
+        name for name, section in QSS_SECTIONS.items()
+        if name in names or section.classes & present
+    )
+
+
+@lru_cache(maxsize=32)
+def _sections_template(names: tuple[str, ...]) -> CompiledTemplate:
+    return CompiledTemplate("".join(QSS_SECTIONS[name].source for name in names))
+
+
+@lru_cache(maxsize=32)
+def changed_selectors(old: Colors, new: Colors) -> tuple[str, ...]:
+    """Selectors whose resolved declarations differ between two palettes.
+    
+    Only color tokens vary between palettes, so a rule changes exactly when
+    one of the ``c.*`` tokens (or ``i.*`` glyphs colored from them) it
+    references has a different value.
+    """
+    old_icons, new_icons = qss_icons(old), qss_icons(new)
+    changed = []
+    for selector, fields in _QSS_RULES:
+        if any(
+            (ns == "c" and getattr(old, attr) != getattr(new, attr))
+            or (ns == "i" and getattr(old_icons, attr) != getattr(new_icons, attr))
+            for ns, attr in fields
+        ):
+            changed.append(selector)
+    return tuple(changed)
+
+
+def render_template(
+    template: CompiledTemplate,
+    colors: Colors,
+    spacing: Spacing = SPACING,
+    radius: Radius = RADIUS,
+    typography: Typography = TYPOGRAPHY,
+) -> str:
+    """Fill a QSS template: ``c`` colors, ``i`` glyph resource paths, ``r``/``s``/``t`` sizes.
+
+    ``e`` is ``CARD_SHADOW``, the elevated cards' painted shadow.
+    """
+    return template.render(
+        c=colors, e=CARD_SHADOW, i=qss_icons(colors), r=radius, s=spacing, t=typography
+    )
+
+
+def token_hash(key: tuple) -> str:
+    """Short hash of the template plus a ``(colors, spacing, radius, typography)`` key.
+    
+    Names stylesheets in the on-disk stores; it changes whenever a token or
+    the template does.
+    """
+    digest = _QSS_SOURCE_HASH.copy()
+    digest.update(repr(key).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
 class Theme:
     """Rosewood theme manager.
     
@@ -36,29 +307,580 @@ class Theme:
         # Or light mode
         theme = Theme(ThemeMode.LIGHT)
         theme.apply(app)
+        
+        # Or a palette derived from a brand color
+        theme = Theme.from_accent("#4a90d9", ThemeMode.LIGHT)
+    
+    Rendered stylesheets are cached per token set and shared by all
+    ``Theme`` instances, so re-applying a theme is a dictionary lookup.
+    On a memory miss the stylesheets shipped with the package
+    (``prebuilt``, compiled by ``rosewood build-tokens``) and then the
+    on-disk ``disk_cache`` are consulted before rendering; set either to
+    ``None`` to skip it.
+    
+    The last theme passed to ``apply()`` is the *active* theme. Code that
+    styles itself outside the stylesheet (shadows, custom painting) can
+    ``Theme.subscribe()`` to be told when the active colors change.
     """
     
-    def __init__(self, mode: ThemeMode = ThemeMode.DARK) -> None:
+    _qss_cache = QssCache()
+    prebuilt: Optional[QssStore] = QssStore(PREBUILT_DIR, read_only=True)
+    disk_cache: Optional[QssStore] = QssStore.from_env()
+    
+    _active: Optional[Theme] = None
+    _broadcast_colors: Optional[Colors] = None
+    _listeners: dict[weakref.ref, None] = {}
+    # Target -> its latest apply_async() request, cancelled by newer ones
+    _pending: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    # Targets holding a Rosewood stylesheet -> (theme that installed it,
+    # whether it is scoped (pruned))
+    _styled: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    # Targets themed with engine="palette" -> their RosewoodStyle
+    _palettes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    
+    def __init__(self, mode: ThemeMode = ThemeMode.DARK, colors: Optional[Colors] = None) -> None:
+        """``colors`` replaces the built-in palette of ``mode``.
+        
+        ``mode`` should still say whether the palette is dark or light; it
+        names the stored stylesheet and is what ``toggle()`` flips. Equal
+        palettes are shared through ``intern_palette``.
+        """
         self.mode = mode
-        self._colors = DarkColors if mode == ThemeMode.DARK else LightColors
+        self._seeds: Optional[tuple[str, Optional[str]]] = None
+        self._switches = 0
+        self._colors = intern_palette(colors) if colors is not None else self._colors_for(mode)
+    
+    @classmethod
+    def from_accent(
+        cls,
+        accent: str,
+        mode: ThemeMode = ThemeMode.DARK,
+        secondary: Optional[str] = None,
+    ) -> Theme:
+        """A theme whose accent (and optionally secondary) family is derived from one color.
+        
+        Shades and tints are computed in OKLCH (``rosewood.colormath``) and
+        memoized, and the result feeds the shared stylesheet cache, so
+        switching back to a tenant palette seen before is a lookup.
+        ``toggle()`` re-derives the palette for the other mode.
+        
+        Usage:
+            theme = Theme.from_accent("#4a90d9", secondary="#8a6cd0")
+            theme.apply(app)
+        """
+        from rosewood.colormath import derive_colors
+        
+        theme = cls(mode, colors=derive_colors(accent, mode.value, secondary))
+        theme._seeds = (accent, secondary)
+        return theme
+    
+    def _colors_for(self, mode: ThemeMode) -> Colors:
+        if self._seeds is not None:
+            from rosewood.colormath import derive_colors
+            
+            return derive_colors(self._seeds[0], mode.value, self._seeds[1])
+        return DarkColors if mode == ThemeMode.DARK else LightColors
     
     @property
     def colors(self) -> Colors:
         return self._colors
     
-    def toggle(self) -> None:
-        """Toggle between dark and light mode."""
+    @property
+    def palette(self) -> PackedPalette:
+        """Pre-parsed tokens with cached ``QColor``/``QBrush``/``QPen`` objects."""
+        return packed_palette(self._colors)
+    
+    @classmethod
+    def active(cls) -> Theme:
+        """The most recently applied theme (dark if none was applied yet)."""
+        if cls._active is None:
+            cls._active = Theme()
+        return cls._active
+    
+    @classmethod
+    def subscribe(cls, callback: Callable[[Theme], None]) -> None:
+        """Call ``callback(theme)`` whenever the active theme's colors change.
+        
+        Only a weak reference is kept: a bound method is dropped as soon as
+        its object is garbage collected, so subscribers never need to
+        unsubscribe to avoid leaks.
+        """
+        listeners = cls._listeners
+        
+        def on_dead(ref: weakref.ref) -> None:
+            listeners.pop(ref, None)
+        
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback, on_dead)
+        else:
+            ref = weakref.ref(callback, on_dead)
+        listeners[ref] = None
+    
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[Theme], None]) -> None:
+        if hasattr(callback, "__self__"):
+            cls._listeners.pop(weakref.WeakMethod(callback), None)
+        else:
+            cls._listeners.pop(weakref.ref(callback), None)
+    
+    @classmethod
+    def subscribers(cls) -> list[Callable[[Theme], None]]:
+        """The callbacks currently subscribed (collected ones left out)."""
+        callbacks = (ref() for ref in list(cls._listeners))
+        return [callback for callback in callbacks if callback is not None]
+    
+    def _activate(self) -> None:
+        """Make this the active theme and notify subscribers of new colors."""
+        Theme._active = self
+        if Theme._broadcast_colors == self._colors:
+            return
+        Theme._broadcast_colors = self._colors
+        # One pass over a snapshot of the live subscribers, since collection
+        # of a dead one during a callback mutates the registry.
+        for callback in Theme.subscribers():
+            callback(self)
+    
+    def toggle(
+        self,
+        target: Optional[QWidget | QApplication] = None,
+        *,
+        incremental: bool = False,
+    ) -> Optional[ThemeSwitch]:
+        """Toggle between dark and light mode.
+        
+        Themes from ``from_accent`` switch to the derived palette of the
+        other mode; any other theme switches to a built-in palette.
+        
+        Without a target only the palette is swapped and callers re-apply
+        the theme themselves. With a target the theme is applied again
+        the way ``target`` was last themed (engine, scoped sheet).
+        
+        ``incremental=True`` diffs the two palettes first and skips the
+        restyle when no rule changed. Otherwise every stylesheet this theme
+        installed under ``target`` is replaced, one per event-loop tick, so
+        input keeps flowing between them: the application sheet first
+        (Qt re-polishes every widget for it, so it cannot be split), then
+        each widget or window themed with ``apply(widget)`` or
+        ``apply(window, scoped=True)``. Scoped windows holding none of the
+        changed classes are left alone. Each window repaints once. A
+        ``ThemeSwitch`` report is returned; subscribers are notified when
+        the last sheet is in place. To spread a large UI over ticks, theme
+        its windows rather than the application.
+        
+        Usage:
+            report = theme.toggle(app, incremental=True)
+            report.finished.add_done_callback(lambda f: print(f"{f.result():.1f} ms"))
+        """
+        from concurrent.futures import Future
+        
+        previous = self._colors
         self.mode = ThemeMode.LIGHT if self.mode == ThemeMode.DARK else ThemeMode.DARK
-        self._colors = DarkColors if self.mode == ThemeMode.DARK else LightColors
+        self._colors = self._colors_for(self.mode)
+        self._switches += 1  # stops the ticks of an unfinished switch
+        
+        if target is None:
+            return None
+        if not incremental or target in Theme._palettes:
+            start = time.perf_counter()
+            self._reapply(target)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            finished: Future[float] = Future()
+            finished.set_result(elapsed_ms)
+            return ThemeSwitch(
+                changed_selectors=_QSS_SELECTORS,
+                changed_classes=_QSS_CLASSES,
+                steps=1,
+                elapsed_ms=elapsed_ms,
+                finished=finished,
+            )
+        return self._apply_incremental(target, previous)
+    
+    @traced
+    def _apply_incremental(self, target: QWidget | QApplication, previous: Colors) -> ThemeSwitch:
+        from concurrent.futures import Future
+        
+        from PySide6.QtCore import QTimer
+        from PySide6.QtWidgets import QApplication
+        from shiboken6 import isValid
+        
+        start = time.perf_counter()
+        selectors = changed_selectors(previous, self._colors)
+        classes = frozenset().union(*(selector_classes(selector) for selector in selectors))
+        finished: Future[float] = Future()
+        
+        styled: list[tuple[QWidget | QApplication, bool]] = []
+        if selectors:
+            if isinstance(target, QApplication):
+                # Only sheets this theme installed; other themes' windows stay
+                styled = [
+                    (w, scoped)
+                    for w, (owner, scoped) in list(Theme._styled.items())
+                    if owner is self and isValid(w)
+                ]
+                # The application sheet goes first; it restyles everything
+                styled.sort(key=lambda item: item[0] is not target)
+            else:
+                styled = [(target, Theme._styled.get(target, (self, False))[1])]
+            register_qss_icons(self._colors)
+        
+        switch = self._switches
+        
+        def step(index: int) -> None:
+            if self._switches != switch:
+                finished.cancel()  # superseded by a newer toggle
+                return
+            if index < len(styled):
+                widget, scoped = styled[index]
+                if isValid(widget):
+                    self._restyle(widget, scoped, classes)
+                QTimer.singleShot(0, lambda: step(index + 1))
+                return
+            self._activate()
+            finished.set_result((time.perf_counter() - start) * 1000)
+        
+        step(0)
+        return ThemeSwitch(
+            changed_selectors=selectors,
+            changed_classes=classes,
+            steps=len(styled),
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            finished=finished,
+        )
+    
+    def _restyle(
+        self,
+        widget: QWidget | QApplication,
+        scoped: bool,
+        classes: frozenset[str],
+    ) -> None:
+        """Replace one Rosewood-installed sheet, holding off paints while Qt re-polishes."""
+        if scoped:
+            present = widget_classes(widget)
+            if not present & classes:
+                return
+            qss = self.generate_qss(include=present)
+        else:
+            qss = self.generate_qss()
+        _cancel_pending(widget)
+        windows = [w for w in _windows_of(widget) if w.updatesEnabled()]
+        for window in windows:
+            window.setUpdatesEnabled(False)
+        try:
+            with span("setStyleSheet", target=type(widget).__name__, bytes=len(qss)):
+                widget.setStyleSheet(qss)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+        Theme._styled[widget] = (self, scoped)
     
-    def generate_qss(self) -> str:
-        """Generate complete Qt stylesheet."""
-        c = self._colors
-        r = RADIUS
-        s = SPACING
-        t = TYPOGRAPHY
+    @traced
+    def generate_qss(self, include: Optional[Iterable[str]] = None) -> str:
+        """Generate the Qt stylesheet.
+        
+        ``include`` limits it to some ``QSS_SECTIONS``, given as section
+        names and/or widget class names. Fewer rules mean less selector
+        matching on every polish:
+        
+            theme.generate_qss(include={"buttons", "inputs"})
+            theme.generate_qss(include=detect_sections(window))
+        """
+        if include is None:
+            return self._qss_cache.get(self._cache_key(), self._load_or_render_qss)
+        
+        names = resolve_sections(include)
+        if len(names) == len(QSS_SECTIONS):
+            return self.generate_qss()
+        
+        def render() -> str:
+            return render_template(_sections_template(names), self._colors)
+        
+        return self._qss_cache.get((self._cache_key(), names), render)
+    
+    def _cache_key(self) -> tuple:
+        return (self._colors, SPACING, RADIUS, TYPOGRAPHY)
+    
+    def _token_hash(self) -> str:
+        return token_hash(self._cache_key())
+    
+    @traced
+    def _render_qss(self) -> str:
+        return render_template(_QSS_TEMPLATE, self._colors)
+    
+    def _load_or_render_qss(self) -> str:
+        mode, key = self.mode.value, self._token_hash()
+        for store in (self.prebuilt, self.disk_cache):
+            if store is not None:
+                qss = store.load(mode, key)
+                if qss is not None:
+                    return qss
+        
+        qss = self._render_qss()
+        if self.disk_cache is not None:
+            try:
+                self.disk_cache.save(mode, key, qss)
+            except OSError:
+                pass  # A read-only or full cache dir must never break theming
+        return qss
+    
+    def prebuild(self, store: Optional[QssStore] = None) -> Path:
+        """Render this theme's stylesheet into the on-disk store.
+        
+        Uses ``Theme.disk_cache`` unless another store is given.
+        """
+        store = store or self.disk_cache
+        if store is None:
+            raise ValueError("No QSS store configured (ROSEWOOD_CACHE_DIR is empty)")
+        return store.save(self.mode.value, self._token_hash(), self._render_qss())
+    
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached stylesheets and reset the hit/miss counters."""
+        cls._qss_cache.clear()
+    
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Return stylesheet cache hits, misses, max size and current size."""
+        return cls._qss_cache.info()
+    
+    @traced
+    def apply(
+        self,
+        widget: QWidget | QApplication,
+        engine: str = "qss",
+        scoped: bool = False,
+    ) -> None:
+        """Apply theme to a widget or application.
+        
+        With ``scoped=True`` the stylesheet goes on ``widget``'s top-level
+        window only and holds just the rules for the widget classes found
+        in that window (walked once, now). Other windows keep native
+        styling. Re-apply after adding widget types the window did not
+        have yet.
+        
+        Engines:
+            - qss: Install the generated stylesheet (default)
+            - palette: Clear any stylesheet and install a ``QPalette`` plus
+              ``RosewoodStyle`` built from the same tokens. Much faster for
+              large item views and scrollbars, but Rosewood widgets that
+              rely on property selectors (badge/card variants) fall back to
+              native looks. On a widget, the style is set on its current
+              subtree only. Applying again reuses the target's style.
+        
+        ``toggle(target)`` and ``transition()`` re-apply with the engine
+        and ``scoped`` the target was last themed with.
+        """
+        if engine == "qss":
+            if scoped:
+                widget = _scope_window(widget)
+                qss = self.generate_qss(include=widget_classes(widget))
+            else:
+                qss = self.generate_qss()
+            _cancel_pending(widget)
+            register_qss_icons(self._colors)
+            with span("setStyleSheet", target=type(widget).__name__, bytes=len(qss)):
+                widget.setStyleSheet(qss)
+            Theme._styled[widget] = (self, scoped)
+            Theme._palettes.pop(widget, None)
+        elif engine == "palette":
+            Theme._styled.pop(widget, None)
+            self._apply_palette(widget)
+        else:
+            raise ValueError(f"Unknown theme engine: {engine!r} (expected 'qss' or 'palette')")
+        self._activate()
+    
+    def apply_async(self, widget: QWidget | QApplication, scoped: bool = False) -> Future[str]:
+        """Render the stylesheet on a worker thread, then apply it on the GUI thread.
+        
+        Only ``setStyleSheet`` (and notifying subscribers) runs on the GUI
+        thread; rendering, or loading from the disk caches, does not block
+        input. A newer ``apply_async``/``apply`` on the same target cancels
+        a request still in flight, so rapid toggles end on the last theme.
+        
+        Returns a ``concurrent.futures.Future`` resolving to the applied
+        sheet (callbacks run on the GUI thread), or cancelled if superseded
+        or the widget was deleted. Call from the GUI thread.
+        
+        Usage:
+            theme.toggle()
+            theme.apply_async(app).add_done_callback(lambda f: status.clear())
+        """
+        from concurrent.futures import Future
+        
+        from shiboken6 import isValid
+        
+        from rosewood.background import run_in_background
+        
+        include = None
+        if scoped:
+            widget = _scope_window(widget)
+            include = widget_classes(widget)  # walking widgets stays on this thread
+        # Later toggles of this theme must not change what is rendered
+        renderer = Theme(self.mode, colors=self._colors)
+        
+        future: Future[str] = Future()
+        _cancel_pending(widget)
+        Theme._pending[widget] = future
         
-        return f'''
+        def render() -> Optional[str]:
+            if future.cancelled():
+                return None  # superseded before the worker got to it
+            return renderer.generate_qss(include=include)
+        
+        def finish(qss: Optional[str], error: Optional[BaseException]) -> None:
+            if Theme._pending.get(widget) is future:
+                del Theme._pending[widget]
+            if not isValid(widget):
+                future.cancel()
+            if not future.set_running_or_notify_cancel():
+                return
+            if error is not None:
+                future.set_exception(error)
+                return
+            register_qss_icons(renderer.colors)
+            with span("setStyleSheet", target=type(widget).__name__, bytes=len(qss)):
+                widget.setStyleSheet(qss)
+            Theme._styled[widget] = (self, include is not None)
+            # Subscribers get the colors on screen, even if this theme was
+            # toggled while the request was in flight
+            (self if self._colors == renderer.colors else renderer)._activate()
+            future.set_result(qss)
+        
+        run_in_background(render, finish)
+        return future
+    
+    def transition(
+        self,
+        window: QWidget,
+        duration_ms: int = 250,
+        target: Optional[QWidget | QApplication] = None,
+    ) -> Optional[QVariantAnimation]:
+        """Apply this theme behind a crossfade from ``window``'s current look.
+        
+        One snapshot of the window is grabbed, the stylesheet is applied
+        with the window's updates suspended, and a single overlay fades the
+        snapshot out (``rosewood.transition``), so no widget is animated.
+        ``target`` is where the sheet goes; by default the window if it
+        carries a stylesheet, otherwise the application. A window themed
+        with ``apply(window, scoped=True)`` gets a scoped sheet again. Returns the
+        animation, or ``None`` if the window is hidden.
+        
+        Usage:
+            theme.toggle()
+            theme.transition(window)
+        """
+        from PySide6.QtWidgets import QApplication
+        
+        from rosewood.transition import crossfade
+        
+        if target is None:
+            window = window.window()
+            target = window if window.styleSheet() else QApplication.instance()
+        return crossfade(window, lambda: self._reapply(target), duration_ms)
+    
+    def _reapply(self, target: QWidget | QApplication) -> None:
+        """Apply again the way ``target`` was last themed (engine, scoped sheet)."""
+        if target in Theme._palettes:
+            self.apply(target, engine="palette")
+        else:
+            self.apply(target, scoped=Theme._styled.get(target, (self, False))[1])
+    
+    def _apply_palette(self, widget: QWidget | QApplication) -> None:
+        from PySide6.QtWidgets import QApplication, QWidget
+        from shiboken6 import isValid
+        
+        from rosewood.style import RosewoodStyle, build_palette
+        
+        # Re-applying reuses the target's style rather than stacking new ones
+        style = Theme._palettes.get(widget)
+        if style is not None and isValid(style):
+            style.set_colors(self._colors)
+        else:
+            style = RosewoodStyle(self._colors)
+            if not isinstance(widget, QApplication):
+                style.setParent(widget)  # QWidget.setStyle does not take ownership
+        Theme._palettes[widget] = style
+        widget.setStyleSheet("")
+        if isinstance(widget, QApplication):
+            widget.setStyle(style)  # the application takes ownership
+        else:
+            for child in [widget, *widget.findChildren(QWidget)]:
+                child.setStyle(style)
+        widget.setPalette(build_palette(self._colors))
+
+
+def _scope_window(widget: QWidget | QApplication) -> QWidget:
+    from PySide6.QtWidgets import QWidget
+
+    if not isinstance(widget, QWidget):
+        raise ValueError("Scoped apply needs a widget, not the application")
+    return widget.window()
+
+
+def _cancel_pending(target: QWidget | QApplication) -> None:
+    """Cancel an ``apply_async`` on ``target`` that has not been applied yet."""
+    future = Theme._pending.pop(target, None)
+    if future is not None:
+        future.cancel()
+
+
+def _windows_of(target: QWidget | QApplication) -> list[QWidget]:
+    from PySide6.QtWidgets import QApplication
+
+    if isinstance(target, QApplication):
+        return [w for w in target.topLevelWidgets() if w.isVisible()]
+    return [target.window()]
+
+
+def widgets_in(target: QWidget | QApplication) -> list[QWidget]:
+    """``target`` and its descendants, or every widget of the application."""
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    if isinstance(target, QApplication):
+        return target.allWidgets()
+    return [target, *target.findChildren(QWidget)]
+
+
+def widget_classes(target: QWidget | QApplication) -> frozenset[str]:
+    """Qt class names (with all base classes) of the widgets in ``target``.
+    
+    ``target`` is a widget (itself and its descendants) or the application
+    (every widget).
+    """
+    chains: dict[str, tuple[str, ...]] = {}
+    classes: set[str] = set()
+    for widget in widgets_in(target):
+        meta = widget.metaObject()
+        name = meta.className()
+        if name in chains:
+            continue
+        chain = []
+        while meta is not None:
+            chain.append(meta.className())
+            meta = meta.superClass()
+        chains[name] = tuple(chain)
+        classes.update(chain)
+    return frozenset(classes)
+
+
+def detect_sections(target: QWidget | QApplication) -> frozenset[str]:
+    """The ``QSS_SECTIONS`` needed by the widgets currently in ``target``."""
+    return frozenset(resolve_sections(widget_classes(target)))
+
+
+def apply_theme(widget: QWidget | QApplication, mode: ThemeMode = ThemeMode.DARK) -> Theme:
+    """Convenience function to apply theme.
+    
+    Usage:
+        from rosewood import apply_theme
+        apply_theme(app)
+    """
+    theme = Theme(mode)
+    theme.apply(widget)
+    return theme
+
+
+_QSS_SECTION_SOURCES = (
+    ("global", '''
 /* ==========================================================================
    🌹 ROSEWOOD UI — Qt Stylesheet
    Generated from @rosewood-ui design tokens
@@ -75,7 +897,8 @@ QWidget {{
 QMainWindow, QDialog {{
     background: {c.bg};
 }}
-
+'''),
+    ("labels", '''
 /* ── Labels ── */
 QLabel {{
     color: {c.text};
@@ -94,7 +917,8 @@ QLabel[class="secondary"] {{
 QLabel[class="accent"] {{
     color: {c.accent};
 }}
-
+'''),
+    ("buttons", '''
 /* ── Buttons ── */
 QPushButton {{
     background: {c.surface};
@@ -153,7 +977,8 @@ QPushButton[class="ghost"]:hover {{
     background: {c.surface_hover};
     color: {c.text};
 }}
-
+'''),
+    ("inputs", '''
 /* ── Inputs ── */
 QLineEdit, QTextEdit, QPlainTextEdit {{
     background: {c.bg};
@@ -173,7 +998,8 @@ QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
 QLineEdit::placeholder {{
     color: {c.text_muted};
 }}
-
+'''),
+    ("combobox", '''
 /* ── ComboBox ── */
 QComboBox {{
     background: {c.bg};
@@ -195,10 +1021,9 @@ QComboBox::drop-down {{
 }}
 
 QComboBox::down-arrow {{
-    image: none;
-    border-left: 5px solid transparent;
-    border-right: 5px solid transparent;
-    border-top: 6px solid {c.text_muted};
+    image: url({i.combo_arrow});
+    width: 12px;
+    height: 12px;
 }}
 
 QComboBox QAbstractItemView {{
@@ -209,7 +1034,8 @@ QComboBox QAbstractItemView {{
     selection-background-color: {c.accent_bg};
     selection-color: {c.accent_text};
 }}
-
+'''),
+    ("checkbox", '''
 /* ── Checkbox & Radio ── */
 QCheckBox, QRadioButton {{
     color: {c.text};
@@ -227,6 +1053,7 @@ QCheckBox::indicator {{
 QCheckBox::indicator:checked {{
     background: {c.accent};
     border-color: {c.accent};
+    image: url({i.check});
 }}
 
 QRadioButton::indicator {{
@@ -240,8 +1067,10 @@ QRadioButton::indicator {{
 QRadioButton::indicator:checked {{
     background: {c.accent};
     border-color: {c.accent};
+    image: url({i.radio_dot});
 }}
-
+'''),
+    ("scrollbars", '''
 /* ── Scrollbars ── */
 QScrollBar:vertical {{
     background: transparent;
@@ -282,7 +1111,8 @@ QScrollBar::handle:horizontal:hover {{
 QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
     width: 0;
 }}
-
+'''),
+    ("itemviews", '''
 /* ── TreeView & ListView ── */
 QTreeView, QListView, QTableView {{
     background: {c.surface};
@@ -316,7 +1146,8 @@ QHeaderView::section {{
     font-size: {t.size_sm}px;
     text-transform: uppercase;
 }}
-
+'''),
+    ("tabs", '''
 /* ── TabWidget ── */
 QTabWidget::pane {{
     border: 1px solid {c.border};
@@ -340,7 +1171,8 @@ QTabBar::tab:selected {{
     color: {c.accent};
     border-bottom-color: {c.accent};
 }}
-
+'''),
+    ("groupbox", '''
 /* ── GroupBox ── */
 QGroupBox {{
     background: {c.surface};
@@ -359,7 +1191,8 @@ QGroupBox::title {{
     padding: 0 {s.sm}px;
     left: {s.md}px;
 }}
-
+'''),
+    ("progressbar", '''
 /* ── ProgressBar ── */
 QProgressBar {{
     background: {c.surface};
@@ -373,7 +1206,8 @@ QProgressBar::chunk {{
     background: {c.accent};
     border-radius: {r.sm}px;
 }}
-
+'''),
+    ("slider", '''
 /* ── Slider ── */
 QSlider::groove:horizontal {{
     background: {c.border};
@@ -392,7 +1226,8 @@ QSlider::handle:horizontal {{
 QSlider::handle:horizontal:hover {{
     background: {c.accent_dark};
 }}
-
+'''),
+    ("spinbox", '''
 /* ── SpinBox ── */
 QSpinBox, QDoubleSpinBox {{
     background: {c.bg};
@@ -405,7 +1240,8 @@ QSpinBox, QDoubleSpinBox {{
 QSpinBox:focus, QDoubleSpinBox:focus {{
     border-color: {c.accent};
 }}
-
+'''),
+    ("tooltip", '''
 /* ── ToolTip ── */
 QToolTip {{
     background: {c.surface_elevated};
@@ -414,7 +1250,8 @@ QToolTip {{
     border-radius: {r.sm}px;
     padding: {s.sm}px {s.md}px;
 }}
-
+'''),
+    ("menu", '''
 /* ── Menu ── */
 QMenu {{
     background: {c.surface};
@@ -438,27 +1275,110 @@ QMenu::separator {{
     background: {c.border_light};
     margin: {s.xs}px {s.sm}px;
 }}
-
+'''),
+    ("statusbar", '''
 /* ── StatusBar ── */
 QStatusBar {{
     background: {c.surface};
     color: {c.text_secondary};
     border-top: 1px solid {c.border_light};
 }}
-'''
-    
-    def apply(self, widget: QWidget | QApplication) -> None:
-        """Apply theme to a widget or application."""
-        widget.setStyleSheet(self.generate_qss())
+'''),
+    ("rw-views", '''
+/* ── Rw item views (RwItemDelegate paints items itself) ── */
+RwTableView, RwTreeView, RwListView {{
+    selection-background-color: transparent;
+    selection-color: {c.accent_text};
+}}
 
+RwTreeView::item, RwListView::item,
+RwTreeView::item:hover, RwListView::item:hover,
+RwTreeView::item:selected, RwListView::item:selected {{
+    background: transparent;
+    padding: 0;
+}}
+'''),
+    ("card", '''
+/* ── RwCard ── */
+RwCard {{
+    background: {c.surface};
+    border: 1px solid {c.border_light};
+    border-radius: {r.lg}px;
+    padding: {s.lg}px;
+}}
 
-def apply_theme(widget: QWidget | QApplication, mode: ThemeMode = ThemeMode.DARK) -> Theme:
-    """Convenience function to apply theme.
-    
-    Usage:
-        from rosewood import apply_theme
-        apply_theme(app)
-    """
-    theme = Theme(mode)
-    theme.apply(widget)
-    return theme
+RwCard[variant="elevated"] {{
+    background: transparent;
+    border: none;
+    /* Room for the painted shadow; RwCard paints the surface with it */
+    margin: {e.qss_margin};
+}}
+'''),
+    ("toast", '''
+/* ── RwToast (rosewood.toast) ── */
+RwToastCard {{
+    padding: {s.sm}px {s.md}px;
+}}
+
+RwToastCard QPushButton {{
+    min-height: 0;
+    padding: 0 {s.sm}px;
+}}
+'''),
+    ("badge", '''
+/* ── RwBadge ── */
+RwBadge {{
+    background: {c.surface};
+    color: {c.text_secondary};
+    border: 1px solid {c.border_light};
+    border-radius: {r.full}px;
+    padding: 4px 12px;
+    font-size: 12px;
+    font-weight: 600;
+}}
+
+RwBadge[variant="accent"] {{
+    background: {c.accent_bg};
+    color: {c.accent_text};
+    border-color: {c.accent_light};
+}}
+
+RwBadge[variant="success"] {{
+    background: {c.success_bg};
+    color: {c.success};
+    border-color: transparent;
+}}
+
+RwBadge[variant="danger"] {{
+    background: {c.danger_bg};
+    color: {c.danger};
+    border-color: transparent;
+}}
+
+RwBadge[variant="warning"] {{
+    background: {c.warning_bg};
+    color: {c.warning};
+    border-color: transparent;
+}}
+
+RwBadge[variant="info"] {{
+    background: {c.info_bg};
+    color: {c.info};
+    border-color: transparent;
+}}
+'''),
+)
+
+_QSS_SOURCE = "".join(source for _, source in _QSS_SECTION_SOURCES)
+
+_QSS_TEMPLATE = CompiledTemplate(_QSS_SOURCE)
+_QSS_RULES = _compile_rules(_QSS_SOURCE)
+_QSS_SELECTORS = tuple(selector for selector, _ in _QSS_RULES)
+_QSS_CLASSES = frozenset().union(*(selector_classes(selector) for selector in _QSS_SELECTORS))
+_QSS_SOURCE_HASH = hashlib.sha256((_QSS_SOURCE + repr(CARD_SHADOW)).encode("utf-8"))
+
+# Section registry: name -> QssSection, in stylesheet order.
+QSS_SECTIONS: dict[str, QssSection] = {
+    name: QssSection(name, _subject_classes(source), source)
+    for name, source in _QSS_SECTION_SOURCES
+}
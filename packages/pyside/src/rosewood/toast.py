@@ -0,0 +1,343 @@
+"""🌹 Rosewood toasts.
+
+``RwToast`` stacks transient notifications in a corner of a window, like
+the React ``ToastProvider``. It is built for bursts: ``show()`` only
+records the message, and one frame tick per ~16 ms applies everything
+that happened since, so hundreds of calls per second cost a dictionary
+update each rather than a layout pass or an animation each.
+
+- A fixed pool of ``RwToastCard`` overlays is reused; no widget is created
+  per message.
+- A message equal to one already shown or queued (same text and variant)
+  bumps that toast's count and restarts its timer instead of stacking.
+- New toasts appear at most ``rate`` per second; the rest wait in a
+  bounded queue (the oldest are dropped and counted when it overflows).
+- Slide animations are stepped by the same frame tick for all cards.
+
+Usage:
+    toasts = RwToast(window)
+    toasts.show("Saved")
+    toasts.show("Disk almost full", "warning", duration_ms=8000)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+from PySide6.QtWidgets import QHBoxLayout, QSizePolicy, QWidget
+from shiboken6 import isValid
+
+from rosewood.colors import SPACING
+from rosewood.instrument import traced
+from rosewood.widgets import RwBadge, RwButton, RwCard, RwLabel
+
+FRAME_MS = 16
+SLIDE_MS = 180
+
+# Card width range (matches the React Toast)
+MIN_WIDTH = 280
+MAX_WIDTH = 420
+
+
+class RwToastCard(RwCard):
+    """One pooled toast: variant badge, message, repeat count and close button."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__("elevated", parent)
+        self.setAttribute(Qt.WA_StyledBackground)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(SPACING.sm)
+
+        self.badge = RwBadge(parent=self)
+        self.label = RwLabel(parent=self)
+        self.label.setWordWrap(True)
+        self.label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.count = RwBadge(variant="accent", parent=self)
+        self.close_button = RwButton("×", variant="ghost", parent=self)
+        self.close_button.setFocusPolicy(Qt.NoFocus)
+        self.close_button.setCursor(Qt.PointingHandCursor)
+
+        layout.addWidget(self.badge, 0, Qt.AlignVCenter)
+        layout.addWidget(self.label, 1)
+        layout.addWidget(self.count, 0, Qt.AlignVCenter)
+        layout.addWidget(self.close_button, 0, Qt.AlignVCenter)
+
+    def bind(self, message: str, variant: str, count: int) -> None:
+        self.label.setText(message)
+        self.badge.setVisible(variant != "default")
+        self.badge.setText(variant)
+        self.badge.variant = variant
+        self.set_count(count)
+
+    def set_count(self, count: int) -> None:
+        self.count.setVisible(count > 1)
+        self.count.setText(f"×{count}")
+
+
+class _Toast:
+    """A message and, while on screen, its card and slide state."""
+
+    __slots__ = (
+        "key", "message", "variant", "duration_ms", "count", "deadline",
+        "card", "height", "dirty", "leaving", "start", "origin", "target",
+    )
+
+    def __init__(self, message: str, variant: str, duration_ms: int) -> None:
+        self.key = (message, variant)
+        self.message = message
+        self.variant = variant
+        self.duration_ms = duration_ms
+        self.count = 1
+        self.deadline = float("inf")
+        self.card: Optional[RwToastCard] = None
+        self.height = 0
+        self.dirty = True
+        self.leaving = False
+        # Slide from origin to target (x, y), started at ``start`` (seconds)
+        self.start = 0.0
+        self.origin = (0, 0)
+        self.target = (0, 0)
+
+
+def _ease_out(progress: float) -> float:
+    return 1 - (1 - progress) ** 3
+
+
+class RwToast(QObject):
+    """Notification stack over the bottom-right corner of ``window``.
+
+    ``max_visible`` toasts are on screen at once (the card pool holds twice
+    that, so leaving cards can finish sliding out). ``rate`` limits how
+    many new toasts appear per second, with bursts up to ``max_visible``;
+    up to ``max_queued`` distinct messages wait their turn. A
+    ``duration_ms`` of 0 keeps a toast until it is closed.
+
+    Usage:
+        toasts = RwToast(window, max_visible=3)
+        for event in incident_events:
+            toasts.show(event.summary, "danger")   # repeats collapse to "×N"
+    """
+
+    def __init__(
+        self,
+        window: QWidget,
+        max_visible: int = 4,
+        duration_ms: int = 4000,
+        rate: float = 8.0,
+        max_queued: int = 100,
+    ) -> None:
+        super().__init__(window)
+        self._window = window
+        self._max_visible = max_visible
+        self._duration_ms = duration_ms
+        self._rate = rate
+        self._max_queued = max_queued
+        self._margin = SPACING.lg
+
+        # (message, variant) -> toast, for everything shown or queued
+        self._by_key: dict[tuple[str, str], _Toast] = {}
+        self._queue: OrderedDict[tuple[str, str], _Toast] = OrderedDict()
+        self._shown: list[_Toast] = []   # bottom to top, leaving ones included
+        self._pool: list[RwToastCard] = []
+        self._free: list[RwToastCard] = []
+        self._tokens = float(max_visible)
+        self._refilled = time.monotonic()
+        self._restack = False   # re-target the cards on the next tick
+        self._resized = False   # ... and jump rather than slide
+        self.dropped = 0
+
+        self._frame = QTimer(self)
+        self._frame.setInterval(FRAME_MS)
+        self._frame.timeout.connect(self._tick)
+        # Wakes the frame tick for the next expiry or rate-limit refill
+        self._wake = QTimer(self)
+        self._wake.setSingleShot(True)
+        self._wake.timeout.connect(self._frame.start)
+        window.installEventFilter(self)
+
+    def show(
+        self,
+        message: str,
+        variant: str = "default",
+        duration_ms: Optional[int] = None,
+    ) -> None:
+        """Queue a toast, or bump the count of an equal one already shown or queued."""
+        toast = self._by_key.get((message, variant))
+        if toast is not None:
+            toast.count += 1
+            toast.dirty = True
+            if toast.card is not None and toast.duration_ms > 0:
+                toast.deadline = time.monotonic() + toast.duration_ms / 1000
+        else:
+            if duration_ms is None:
+                duration_ms = self._duration_ms
+            toast = _Toast(message, variant, duration_ms)
+            self._by_key[toast.key] = toast
+            self._queue[toast.key] = toast
+            if len(self._queue) > self._max_queued:
+                _, oldest = self._queue.popitem(last=False)
+                del self._by_key[oldest.key]
+                self.dropped += oldest.count
+        if not self._frame.isActive():
+            self._frame.start()
+
+    def dismiss_all(self) -> None:
+        """Slide out every toast and forget the queue."""
+        for toast in self._queue.values():
+            del self._by_key[toast.key]
+        self._queue.clear()
+        for toast in self._shown:
+            self._leave(toast)
+        self._frame.start()
+
+    @property
+    def visible_count(self) -> int:
+        return sum(1 for toast in self._shown if not toast.leaving)
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queue)
+
+    @property
+    def pool_size(self) -> int:
+        """Cards created so far (at most ``2 * max_visible``)."""
+        return len(self._pool)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self._window and event.type() == QEvent.Resize:
+            self._resized = True
+            self._frame.start()
+        return False
+
+    @traced(name="toast-frame")
+    def _tick(self) -> None:
+        if not isValid(self._window):
+            self._frame.stop()
+            return
+        now = time.monotonic()
+        for toast in self._shown:
+            if not toast.leaving and toast.deadline <= now:
+                self._leave(toast)
+        self._promote(now)
+
+        for toast in self._shown:
+            if toast.dirty and toast.card is not None:
+                toast.card.set_count(toast.count)
+                toast.dirty = False
+        if self._restack or self._resized:
+            self._layout(now, animate=not self._resized)
+            self._restack = self._resized = False
+
+        if not self._step(now):
+            self._frame.stop()
+            self._schedule_wake(now)
+
+    def _promote(self, now: float) -> None:
+        """Move queued toasts into free slots, within the rate limit."""
+        self._tokens = min(self._max_visible, self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+        while (
+            self._queue
+            and self._tokens >= 1
+            and self.visible_count < self._max_visible
+            and (self._free or len(self._pool) < 2 * self._max_visible)
+        ):
+            _, toast = self._queue.popitem(last=False)
+            self._tokens -= 1
+            card = self._free.pop() if self._free else self._new_card()
+            card.bind(toast.message, toast.variant, toast.count)
+            toast.card = card
+            toast.dirty = False
+            if toast.duration_ms > 0:
+                toast.deadline = now + toast.duration_ms / 1000
+            self._shown.insert(0, toast)
+            self._restack = True
+
+    def _new_card(self) -> RwToastCard:
+        card = RwToastCard(self._window)
+        card.hide()
+        card.close_button.clicked.connect(lambda: self._close(card))
+        self._pool.append(card)
+        return card
+
+    def _close(self, card: RwToastCard) -> None:
+        for toast in self._shown:
+            if toast.card is card and not toast.leaving:
+                self._leave(toast)
+                self._frame.start()
+                return
+
+    def _leave(self, toast: _Toast) -> None:
+        toast.leaving = True
+        if self._by_key.get(toast.key) is toast:
+            del self._by_key[toast.key]
+        self._restack = True
+
+    def _width(self) -> int:
+        available = self._window.width() - 2 * self._margin
+        return max(min(MAX_WIDTH, available), min(MIN_WIDTH, available))
+
+    def _layout(self, now: float, animate: bool) -> None:
+        """Retarget every card: a bottom-up stack, leaving cards off to the right."""
+        width = self._width()
+        x = self._window.width() - self._margin - width
+        y = self._window.height() - self._margin
+        for toast in self._shown:
+            card = toast.card
+            if card.width() != width or not toast.height:
+                card.setFixedWidth(width)
+                toast.height = card.heightForWidth(width)
+                if toast.height < 0:
+                    toast.height = card.sizeHint().height()
+                card.setFixedHeight(toast.height)
+            if toast.leaving:
+                target = (self._window.width(), card.y())
+            else:
+                # The elevated cards' shadow margins space them apart
+                y -= toast.height
+                target = (x, y)
+            if card.isHidden():
+                # Enter from the right at its slot
+                toast.origin = (self._window.width(), target[1])
+                card.move(*toast.origin)
+                card.show()
+                card.raise_()
+            else:
+                toast.origin = (card.x(), card.y())
+            toast.target = target
+            toast.start = now
+            if not animate and not toast.leaving:
+                toast.origin = target
+
+    def _step(self, now: float) -> bool:
+        """Advance every slide to ``now``; True while any is still moving."""
+        moving = False
+        for toast in list(self._shown):
+            progress = min(1.0, (now - toast.start) * 1000 / SLIDE_MS)
+            eased = _ease_out(progress)
+            (x0, y0), (x1, y1) = toast.origin, toast.target
+            toast.card.move(round(x0 + (x1 - x0) * eased), round(y0 + (y1 - y0) * eased))
+            if progress < 1.0:
+                moving = True
+            elif toast.leaving:
+                self._release(toast)
+        return moving
+
+    def _release(self, toast: _Toast) -> None:
+        self._shown.remove(toast)
+        toast.card.hide()
+        self._free.append(toast.card)
+        toast.card = None
+
+    def _schedule_wake(self, now: float) -> None:
+        """Restart the frame tick at the next expiry, or when a queued toast may enter."""
+        deadlines = [toast.deadline for toast in self._shown if not toast.leaving]
+        if self._queue and self.visible_count < self._max_visible:
+            deadlines.append(now + (1 - self._tokens) / self._rate)
+        wake = min(deadlines, default=float("inf"))
+        if wake != float("inf"):
+            self._wake.start(max(FRAME_MS, round((wake - now) * 1000)))
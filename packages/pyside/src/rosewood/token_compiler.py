@@ -0,0 +1,225 @@
+"""🌹 Rosewood token compiler.
+
+``packages/css/src/variables.css`` is the single source of truth for the
+design tokens. This compiles its ``:root`` (dark) and
+``[data-theme="light"]`` blocks into:
+
+- ``rosewood/tokens.py``: plain constants that ``rosewood.colors`` builds
+  its palettes from, so importing them never parses CSS;
+- ``rosewood/prebuilt/*.qss``: the rendered stylesheet for each built-in
+  palette, which ``Theme`` loads instead of rendering.
+
+Usage:
+    rosewood build-tokens            # regenerate both
+    rosewood build-tokens --check    # exit 1 if either is out of date (CI)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+from typing import NamedTuple
+
+from rosewood.colors import Colors, Radius, Spacing, Typography
+
+# packages/pyside/src/rosewood -> packages/css/src/variables.css
+DEFAULT_CSS = Path(__file__).resolve().parents[3] / "css" / "src" / "variables.css"
+TOKENS_PATH = Path(__file__).with_name("tokens.py")
+
+DARK_SELECTOR = ":root"
+LIGHT_SELECTOR = '[data-theme="light"]'
+
+# CSS rem -> Qt pixels (the browser default root font size).
+REM_PX = 16
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_AT_RULE_RE = re.compile(r"""@[\w-]+(?:[^;{'"]|'[^']*'|"[^"]*")*;""")
+_BLOCK_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_DECL_RE = re.compile(r"--rw-([\w-]+)\s*:\s*([^;]+);")
+_RGBA_RE = re.compile(r"(rgba?)\(([^)]*)\)")
+
+# CSS suffixes that are not valid Python identifiers.
+_SIZE_NAMES = {"2xl": "xxl", "3xl": "xxxl"}
+
+_FONTS = {"font": "font_family", "font-heading": "font_heading", "font-mono": "font_mono"}
+
+
+class TokenSet(NamedTuple):
+    """Tokens extracted from ``variables.css``, keyed by Python field name."""
+
+    dark_colors: dict[str, str]
+    light_colors: dict[str, str]
+    spacing: dict[str, int]
+    radius: dict[str, int]
+    fonts: dict[str, str]
+
+
+def parse_variables(text: str) -> dict[str, dict[str, str]]:
+    """``--rw-*`` custom properties per selector (names without the prefix)."""
+    text = _AT_RULE_RE.sub("", _COMMENT_RE.sub("", text))
+    blocks: dict[str, dict[str, str]] = {}
+    for selector, body in _BLOCK_RE.findall(text):
+        declarations = blocks.setdefault(selector.strip(), {})
+        for name, value in _DECL_RE.findall(body):
+            declarations[name] = " ".join(value.split())
+    return blocks
+
+
+def _normalize_color(value: str) -> str:
+    """``rgba(0,0,0,0.4)`` -> ``rgba(0, 0, 0, 0.4)``; hex passes through."""
+    return _RGBA_RE.sub(
+        lambda m: f"{m.group(1)}({', '.join(part.strip() for part in m.group(2).split(','))})",
+        value,
+    )
+
+
+def _pixels(name: str, value: str) -> int:
+    if value.endswith("rem"):
+        return round(float(value[:-3]) * REM_PX)
+    if value.endswith("px"):
+        return int(value[:-2])
+    raise ValueError(f"--rw-{name}: expected px or rem, got {value!r}")
+
+
+def _colors(variables: dict[str, str], selector: str) -> dict[str, str]:
+    colors = {}
+    missing = []
+    for field in fields(Colors):
+        if field.name == "shadow":
+            # Elevation color: the color part of --rw-shadow-md
+            match = _RGBA_RE.search(variables.get("shadow-md", ""))
+            value = match.group(0) if match else None
+        else:
+            value = variables.get(field.name.replace("_", "-"))
+        if value is None:
+            missing.append(field.name)
+        else:
+            colors[field.name] = _normalize_color(value)
+    if missing:
+        raise ValueError(f"{selector} is missing color tokens: {', '.join(missing)}")
+    return colors
+
+
+def _sizes(variables: dict[str, str], prefix: str, cls: type) -> dict[str, int]:
+    sizes = {}
+    for name, value in variables.items():
+        if name.startswith(prefix):
+            key = name[len(prefix):]
+            sizes[_SIZE_NAMES.get(key, key)] = _pixels(name, value)
+    missing = {field.name for field in fields(cls)} - sizes.keys()
+    if missing:
+        raise ValueError(f"missing --rw-{prefix}* tokens for: {', '.join(sorted(missing))}")
+    return sizes
+
+
+def extract_tokens(blocks: dict[str, dict[str, str]]) -> TokenSet:
+    """Map parsed CSS blocks onto the ``rosewood.colors`` dataclasses.
+
+    The light block only overrides what differs, like in the browser.
+    """
+    if DARK_SELECTOR not in blocks or LIGHT_SELECTOR not in blocks:
+        raise ValueError(f"variables.css needs {DARK_SELECTOR} and {LIGHT_SELECTOR} blocks")
+    dark = blocks[DARK_SELECTOR]
+    light = {**dark, **blocks[LIGHT_SELECTOR]}
+    return TokenSet(
+        dark_colors=_colors(dark, DARK_SELECTOR),
+        light_colors=_colors(light, LIGHT_SELECTOR),
+        spacing=_sizes(dark, "space-", Spacing),
+        radius=_sizes(dark, "radius-", Radius),
+        fonts={attr: dark[name] for name, attr in _FONTS.items() if name in dark},
+    )
+
+
+def _literal(value: object) -> str:
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return repr(value)
+
+
+def _dict_source(name: str, values: dict) -> str:
+    lines = [f"{name} = {{"]
+    lines += [f"    {_literal(key)}: {_literal(value)}," for key, value in values.items()]
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render_module(tokens: TokenSet, source: bytes) -> str:
+    """Source of ``rosewood/tokens.py``."""
+    parts = [
+        '"""🌹 Rosewood design tokens.\n\n'
+        "Generated from packages/css/src/variables.css by ``rosewood build-tokens``.\n"
+        'Do not edit: change the CSS and re-run it.\n"""',
+        f'SOURCE_SHA256 = "{hashlib.sha256(source).hexdigest()}"',
+        _dict_source("DARK_COLORS", tokens.dark_colors),
+        _dict_source("LIGHT_COLORS", tokens.light_colors),
+        _dict_source("SPACING", tokens.spacing),
+        _dict_source("RADIUS", tokens.radius),
+        *(f"{attr.upper()} = {_literal(value)}" for attr, value in tokens.fonts.items()),
+    ]
+    return "\n\n".join(parts) + "\n"
+
+
+def render_prebuilt(tokens: TokenSet) -> dict[str, bytes]:
+    """Stylesheet files for the built-in palettes: file name -> contents."""
+    from rosewood.qss_store import QssStore
+    from rosewood.theme import _QSS_TEMPLATE, ThemeMode, render_template, token_hash
+
+    spacing = Spacing(**tokens.spacing)
+    radius = Radius(**tokens.radius)
+    typography = Typography(**tokens.fonts)
+    files = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = QssStore(tmp)
+        for mode, values in (
+            (ThemeMode.DARK, tokens.dark_colors),
+            (ThemeMode.LIGHT, tokens.light_colors),
+        ):
+            colors = Colors(**values)
+            qss = render_template(_QSS_TEMPLATE, colors, spacing, radius, typography)
+            path = store.save(mode.value, token_hash((colors, spacing, radius, typography)), qss)
+            files[path.name] = path.read_bytes()
+    return files
+
+
+def compile_tokens(
+    css_path: Path | str = DEFAULT_CSS,
+    tokens_path: Path | str = TOKENS_PATH,
+    prebuilt_dir: Path | str | None = None,
+    check: bool = False,
+) -> list[Path]:
+    """Regenerate the token module and prebuilt stylesheets from ``css_path``.
+
+    Returns the files that were out of date. With ``check`` nothing is
+    written, so a non-empty result means the build is stale.
+    """
+    from rosewood.theme import PREBUILT_DIR
+
+    source = Path(css_path).read_bytes()
+    tokens = extract_tokens(parse_variables(source.decode("utf-8")))
+    tokens_path = Path(tokens_path)
+    prebuilt_dir = Path(prebuilt_dir or PREBUILT_DIR)
+
+    expected = {tokens_path: render_module(tokens, source).encode("utf-8")}
+    for name, data in render_prebuilt(tokens).items():
+        expected[prebuilt_dir / name] = data
+    leftovers = [
+        path for path in sorted(prebuilt_dir.glob("rosewood-*.qss")) if path not in expected
+    ]
+
+    stale = [
+        path for path, data in expected.items()
+        if not path.is_file() or path.read_bytes() != data
+    ] + leftovers
+    if check:
+        return stale
+
+    prebuilt_dir.mkdir(parents=True, exist_ok=True)
+    for path in leftovers:
+        path.unlink()
+    for path, data in expected.items():
+        if path in stale:
+            path.write_bytes(data)
+    return stale
@@ -0,0 +1,97 @@
+"""🌹 Rosewood design tokens.
+
+Generated from packages/css/src/variables.css by ``rosewood build-tokens``.
+Do not edit: change the CSS and re-run it.
+"""
+
+SOURCE_SHA256 = "05c26d15557116c100dfba681907c869ec91ca2a21e3fbfd2dff6d2860c6fcb9"
+
+DARK_COLORS = {
+    "accent": "#e8a8c0",
+    "accent_dark": "#c0708a",
+    "accent_light": "rgba(232, 168, 192, 0.15)",
+    "accent_bg": "rgba(232, 168, 192, 0.08)",
+    "accent_text": "#e8a8c0",
+    "secondary": "#b898d0",
+    "secondary_dark": "#9878b8",
+    "secondary_light": "rgba(184, 152, 208, 0.15)",
+    "secondary_bg": "rgba(184, 152, 208, 0.08)",
+    "secondary_text": "#b898d0",
+    "bg": "#1a1614",
+    "surface": "#201c1a",
+    "surface_hover": "#352f2b",
+    "surface_elevated": "#2a2420",
+    "border": "#3a3230",
+    "border_light": "#2a2420",
+    "text": "#f5f0ec",
+    "text_secondary": "#a89e98",
+    "text_muted": "#6e6460",
+    "success": "#88c8a8",
+    "success_bg": "rgba(136, 200, 168, 0.1)",
+    "danger": "#e87070",
+    "danger_bg": "rgba(232, 112, 112, 0.1)",
+    "warning": "#e8c070",
+    "warning_bg": "rgba(232, 192, 112, 0.1)",
+    "info": "#70b8e8",
+    "info_bg": "rgba(112, 184, 232, 0.1)",
+    "glass_bg": "rgba(32, 28, 26, 0.72)",
+    "glass_border": "rgba(232, 168, 192, 0.08)",
+    "shadow": "rgba(0, 0, 0, 0.4)",
+}
+
+LIGHT_COLORS = {
+    "accent": "#d4849c",
+    "accent_dark": "#c0708a",
+    "accent_light": "#fce4ec",
+    "accent_bg": "#fce4ec",
+    "accent_text": "#8a3a52",
+    "secondary": "#9878b8",
+    "secondary_dark": "#7a5a9a",
+    "secondary_light": "#d8c8e8",
+    "secondary_bg": "#f3e5f5",
+    "secondary_text": "#5a3878",
+    "bg": "#fefdfb",
+    "surface": "#fff9f5",
+    "surface_hover": "#f0ebe5",
+    "surface_elevated": "#ffffff",
+    "border": "#e8e0dc",
+    "border_light": "#f0e8e4",
+    "text": "#1d1d1f",
+    "text_secondary": "#6e6e73",
+    "text_muted": "#a1a1a6",
+    "success": "#2ea860",
+    "success_bg": "rgba(46, 168, 96, 0.1)",
+    "danger": "#dc3545",
+    "danger_bg": "rgba(220, 53, 69, 0.1)",
+    "warning": "#d4a020",
+    "warning_bg": "rgba(212, 160, 32, 0.1)",
+    "info": "#2080c0",
+    "info_bg": "rgba(32, 128, 192, 0.1)",
+    "glass_bg": "rgba(255, 255, 255, 0.72)",
+    "glass_border": "rgba(0, 0, 0, 0.06)",
+    "shadow": "rgba(0, 0, 0, 0.08)",
+}
+
+SPACING = {
+    "xs": 4,
+    "sm": 8,
+    "md": 16,
+    "lg": 24,
+    "xl": 32,
+    "xxl": 48,
+    "xxxl": 64,
+}
+
+RADIUS = {
+    "sm": 8,
+    "md": 12,
+    "lg": 16,
+    "xl": 24,
+    "full": 9999,
+}
+
+FONT_FAMILY = "'Inter', -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif"
+
+FONT_HEADING = "'Inter', -apple-system, BlinkMacSystemFont, 'SF Pro Display', sans-serif"
+
+FONT_MONO = "'SF Mono', 'Fira Code', 'Cascadia Code', monospace"
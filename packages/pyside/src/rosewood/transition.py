@@ -0,0 +1,100 @@
+"""🌹 Rosewood theme transitions.
+
+Crossfades a window from one theme to the next without animating any
+widget: the old look is grabbed into a single pixmap, the new stylesheet
+is applied while the window's updates are suspended, and one overlay
+widget fades the snapshot out on a ``QVariantAnimation``. The only work
+per frame is blending one pixmap.
+
+Usage:
+    theme.toggle()
+    theme.transition(window, 250)
+
+    crossfade(window, lambda: window.setStyleSheet(qss))   # any restyle
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from PySide6.QtCore import QEasingCurve, QEvent, QObject, Qt, QVariantAnimation
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+
+class SnapshotFade(QWidget):
+    """Overlay painting a snapshot of its parent window at a fading opacity."""
+
+    def __init__(self, window: QWidget, snapshot: QPixmap, duration_ms: int) -> None:
+        super().__init__(window)
+        self._snapshot = snapshot
+        self._opacity = 1.0
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setGeometry(window.rect())
+
+        self.animation = QVariantAnimation(self)
+        self.animation.setStartValue(1.0)
+        self.animation.setEndValue(0.0)
+        self.animation.setDuration(duration_ms)
+        self.animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.animation.valueChanged.connect(self._set_opacity)
+        self.animation.finished.connect(self.deleteLater)
+        window.installEventFilter(self)
+
+    def _set_opacity(self, value: float) -> None:
+        self._opacity = value
+        self.update()
+
+    def start(self) -> None:
+        self.show()
+        self.raise_()
+        self.animation.start()
+
+    def stop(self) -> None:
+        """Drop the overlay immediately (the new theme shows as-is)."""
+        self.animation.stop()
+        self.hide()
+        self.deleteLater()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        # A resized window no longer matches the snapshot
+        if event.type() == QEvent.Resize:
+            self.stop()
+        return False
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(0, 0, self._snapshot)
+
+
+def crossfade(
+    window: QWidget,
+    restyle: Callable[[], None],
+    duration_ms: int = 250,
+) -> Optional[QVariantAnimation]:
+    """Run ``restyle()`` on ``window`` behind a fading snapshot of its old look.
+
+    Returns the running animation, or ``None`` when the window is hidden or
+    ``duration_ms`` is not positive (``restyle`` still runs).
+    """
+    window = window.window()
+    if duration_ms <= 0 or not window.isVisible():
+        restyle()
+        return None
+
+    # Grabbing includes a fade still in progress, so rapid toggles chain smoothly.
+    snapshot = window.grab()
+    for previous in window.findChildren(SnapshotFade, options=Qt.FindDirectChildrenOnly):
+        previous.stop()
+
+    fade = SnapshotFade(window, snapshot, duration_ms)
+    window.setUpdatesEnabled(False)
+    try:
+        fade.start()
+        restyle()
+    finally:
+        window.setUpdatesEnabled(True)
+    return fade.animation
@@ -0,0 +1,328 @@
+"""🌹 Rosewood item views.
+
+Item views for very large models. ``RwItemDelegate`` paints cells straight
+from pre-resolved palette tokens instead of going through the stylesheet
+engine, keeps glyph layouts as ``QStaticText`` and finished cells as
+pixmaps in bounded caches, and reports one fixed row height so the view
+never measures individual rows. Cells that carry roles it does not paint
+(icons, check boxes, alignment, colors, fonts) are left to
+``QStyledItemDelegate``.
+
+Usage:
+    view = RwTableView()
+    view.setModel(model)   # 100k+ rows scroll without per-row styling
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QModelIndex, QPointF, QRect, QSize, Qt
+from PySide6.QtGui import QFontMetrics, QPainter, QPixmap, QStaticText
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QHeaderView,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
+    QTreeView,
+    QWidget,
+)
+from shiboken6 import isValid
+
+from rosewood.colors import RADIUS, SPACING
+from rosewood.theme import Theme
+
+# Cell pixmaps kept per delegate, bounded by pixel memory like QPixmapCache.
+# 16 MiB is ~430 300x32 cells at DPR 1 (a few screens of scroll-back for a
+# 1080p table), a quarter of that at DPR 2. The count bounds the entries
+# without pixels (cells painted by QStyledItemDelegate).
+PIXMAP_CACHE_BYTES = 16 * 1024 * 1024
+PIXMAP_CACHE_SIZE = 2048
+STATIC_TEXT_CACHE_SIZE = 4096
+
+# Raw QStyle.StateFlag bits: flag-enum arithmetic is slow in a per-cell path.
+_SELECTED = QStyle.State_Selected.value
+_HOVER = QStyle.State_MouseOver.value
+_ENABLED = QStyle.State_Enabled.value
+_STATE_MASK = _SELECTED | _HOVER | _ENABLED
+
+# Roles _render ignores; cells with any of them are painted by Qt
+_STYLED_ROLES = (
+    Qt.DecorationRole,
+    Qt.CheckStateRole,
+    Qt.TextAlignmentRole,
+    Qt.ForegroundRole,
+    Qt.BackgroundRole,
+    Qt.FontRole,
+)
+# Pixmap cache entry for cells painted by QStyledItemDelegate
+_STYLED = object()
+# Static text width for unelided layouts (size hints)
+_UNBOUNDED = 1 << 24
+
+
+class _LRU(OrderedDict):
+    """Minimal bounded LRU (single-threaded; GUI thread only).
+
+    Holds at most ``maxsize`` entries and, if given, ``maxcost`` in total
+    ``cost`` (e.g. bytes) as passed to ``store``.
+    """
+
+    def __init__(self, maxsize: int, maxcost: Optional[int] = None) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.maxcost = maxcost
+        self.cost = 0
+        self._costs: dict = {}
+
+    def lookup(self, key):
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key, value, cost: int = 0) -> None:
+        self.cost += cost - self._costs.get(key, 0)
+        self._costs[key] = cost
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.maxsize or (self.maxcost is not None and self.cost > self.maxcost):
+            oldest, _ = self.popitem(last=False)
+            self.cost -= self._costs.pop(oldest)
+
+    def clear(self) -> None:
+        super().clear()
+        self._costs.clear()
+        self.cost = 0
+
+
+def _is_styled(index: QModelIndex) -> bool:
+    return any(index.data(role) is not None for role in _STYLED_ROLES)
+
+
+class RwItemDelegate(QStyledItemDelegate):
+    """Cached, palette-painted delegate for display-only cells.
+
+    Cells are rendered once per (row, column, size, state) into a pixmap and
+    blitted afterwards. Call ``invalidate()`` when cell contents change
+    outside the model's change signals; the Rw*View classes wire those
+    signals up automatically.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._palette = Theme.active().palette
+        self._pixmaps = _LRU(PIXMAP_CACHE_SIZE, PIXMAP_CACHE_BYTES)
+        self._static_text = _LRU(STATIC_TEXT_CACHE_SIZE)
+        self._row_height: Optional[int] = None
+        Theme.subscribe(self._on_theme_changed)
+
+    @property
+    def row_height(self) -> int:
+        """The one row height reported for every index."""
+        if self._row_height is None:
+            parent = self.parent()
+            font = parent.font() if isinstance(parent, QWidget) else QApplication.font()
+            self._row_height = QFontMetrics(font).height() + 2 * SPACING.sm
+        return self._row_height
+
+    def reset_row_height(self) -> None:
+        """Recompute the row height from the view font on next use."""
+        self._row_height = None
+
+    def invalidate(self) -> None:
+        """Drop all cached cell pixmaps (glyph layouts are text-keyed and kept)."""
+        self._pixmaps.clear()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """The text width plus padding (what ``resizeColumnsToContents`` uses)."""
+        if _is_styled(index):
+            return QSize(super().sizeHint(option, index).width(), self.row_height)
+        text = index.data(Qt.DisplayRole)
+        if text is None:
+            return QSize(2 * SPACING.sm, self.row_height)
+        static = self._static_text_for(str(text), _UNBOUNDED, option)
+        return QSize(math.ceil(static.size().width()) + 2 * SPACING.sm, self.row_height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        rect = option.rect
+        if rect.isEmpty():
+            return
+        state = option.state.value & _STATE_MASK
+        dpr = painter.device().devicePixelRatioF()
+
+        key = (
+            index.row(), index.column(), index.internalId(), rect.width(), rect.height(), state, dpr
+        )
+        pixmap = self._pixmaps.lookup(key)
+        if pixmap is None:
+            if _is_styled(index):
+                pixmap = _STYLED
+                self._pixmaps.store(key, pixmap)
+            else:
+                pixmap = self._render(option, index, state, dpr)
+                self._pixmaps.store(key, pixmap, pixmap.width() * pixmap.height() * 4)
+        if pixmap is _STYLED:
+            super().paint(painter, option, index)
+        else:
+            painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def _render(
+        self,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+        state: int,
+        dpr: float,
+    ) -> QPixmap:
+        p = self._palette
+        size = option.rect.size()
+        pixmap = QPixmap(size * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        background = None
+        if state & _SELECTED:
+            background = p.brush("accent_bg")
+        elif state & _HOVER:
+            background = p.brush("surface_hover")
+        if background is not None:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(QRect(0, 0, size.width(), size.height()), RADIUS.sm, RADIUS.sm)
+
+        if not state & _ENABLED:
+            painter.setPen(p.pen("text_muted"))
+        elif state & _SELECTED:
+            painter.setPen(p.pen("accent_text"))
+        else:
+            painter.setPen(p.pen("text"))
+        painter.setFont(option.font)
+
+        text = index.data(Qt.DisplayRole)
+        if text is not None:
+            width = size.width() - 2 * SPACING.sm
+            static = self._static_text_for(str(text), width, option)
+            y = (size.height() - static.size().height()) / 2
+            painter.drawStaticText(QPointF(SPACING.sm, y), static)
+        painter.end()
+        return pixmap
+
+    def _static_text_for(self, text: str, width: int, option: QStyleOptionViewItem) -> QStaticText:
+        key = (text, width, option.font.key())
+        static = self._static_text.lookup(key)
+        if static is None:
+            elided = option.fontMetrics.elidedText(text, Qt.ElideRight, width)
+            static = QStaticText(elided)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(font=option.font)
+            self._static_text.store(key, static)
+        return static
+
+    def _on_theme_changed(self, theme: Theme) -> None:
+        if not isValid(self):
+            Theme.unsubscribe(self._on_theme_changed)
+            return
+        self._palette = theme.palette
+        self.invalidate()
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            view.viewport().update()
+
+
+class _CachedViewMixin:
+    """Shared setup for the Rw*View classes (delegate + cache wiring)."""
+
+    _MODEL_SIGNALS = (
+        "dataChanged",
+        "layoutChanged",
+        "modelReset",
+        "rowsInserted",
+        "rowsRemoved",
+        "rowsMoved",
+        "columnsInserted",
+        "columnsRemoved",
+        "columnsMoved",
+    )
+
+    def _init_cached_view(self) -> None:
+        self._delegate = RwItemDelegate(self)
+        self.setItemDelegate(self._delegate)
+        self.setMouseTracking(True)
+        self._watched_model = None
+
+    def _watch_model(self, model) -> None:
+        invalidate = self._delegate.invalidate
+        if self._watched_model is not None and isValid(self._watched_model):
+            for name in self._MODEL_SIGNALS:
+                getattr(self._watched_model, name).disconnect(invalidate)
+        self._watched_model = model
+        if model is not None:
+            for name in self._MODEL_SIGNALS:
+                getattr(model, name).connect(invalidate)
+        self._delegate.invalidate()
+
+    @property
+    def delegate(self) -> RwItemDelegate:
+        return self._delegate
+
+    def changeEvent(self, event: QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.FontChange:
+            # The stylesheet sets fonts at polish time, after construction.
+            self._delegate.reset_row_height()
+            self._delegate.invalidate()
+            self._row_height_changed(self._delegate.row_height)
+
+    def _row_height_changed(self, height: int) -> None:
+        self.scheduleDelayedItemsLayout()
+
+
+class RwTableView(_CachedViewMixin, QTableView):
+    """Table view with cached delegate painting and fixed row heights."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._init_cached_view()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self._row_height_changed(self._delegate.row_height)
+
+    def _row_height_changed(self, height: int) -> None:
+        self.verticalHeader().setDefaultSectionSize(height)
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        self._watch_model(model)
+
+
+class RwTreeView(_CachedViewMixin, QTreeView):
+    """Tree view with cached delegate painting and uniform row heights."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._init_cached_view()
+        self.setUniformRowHeights(True)
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        self._watch_model(model)
+
+
+class RwListView(_CachedViewMixin, QListView):
+    """List view with cached delegate painting and uniform item sizes."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._init_cached_view()
+        self.setUniformItemSizes(True)
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        self._watch_model(model)
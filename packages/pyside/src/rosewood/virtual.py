@@ -0,0 +1,216 @@
+"""🌹 Rosewood virtualized lists.
+
+``RwVirtualList`` shows every row of a model as a real Rosewood widget
+(cards, badges, anything) but only creates enough of them to fill the
+viewport. Scrolling moves the pooled widgets and rebinds the ones whose
+row changed, so memory and construction cost follow the viewport size,
+not the row count.
+
+Usage:
+    feed = RwVirtualList(item_height=96)              # one RwCard per row
+    feed.setModel(model)
+
+    tags = RwVirtualList(badge_item, bind_badge, item_width=120, item_height=28)
+    tags.setModel(tag_model)                          # a wrapping grid of RwBadges
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PySide6.QtWidgets import QAbstractScrollArea, QVBoxLayout, QWidget
+
+from rosewood.colors import SPACING
+from rosewood.widgets import RwBadge, RwCard, RwLabel
+
+# Model role holding a badge variant name ("accent", "danger", ...).
+VARIANT_ROLE = Qt.UserRole + 1
+
+ItemFactory = Callable[[QWidget], QWidget]
+ItemBinder = Callable[[QWidget, QModelIndex], None]
+
+
+def card_item(parent: QWidget) -> QWidget:
+    """Default item: an ``RwCard`` holding one ``RwLabel`` (``card.label``)."""
+    card = RwCard(parent=parent)
+    layout = QVBoxLayout(card)
+    card.label = RwLabel(parent=card)
+    card.label.setWordWrap(True)
+    layout.addWidget(card.label)
+    return card
+
+
+def bind_card(card: QWidget, index: QModelIndex) -> None:
+    card.label.setText(str(index.data(Qt.DisplayRole) or ""))
+
+
+def badge_item(parent: QWidget) -> QWidget:
+    return RwBadge(parent=parent)
+
+
+def bind_badge(badge: QWidget, index: QModelIndex) -> None:
+    """Text from ``DisplayRole``, variant from ``VARIANT_ROLE`` (default if unset)."""
+    badge.setText(str(index.data(Qt.DisplayRole) or ""))
+    badge.variant = index.data(VARIANT_ROLE) or "default"
+
+
+class RwVirtualList(QAbstractScrollArea):
+    """Scrollable list or grid of recycled item widgets bound to model rows.
+
+    Items have a fixed height. With ``item_width`` the rows wrap into as
+    many columns as fit (items stretch to fill the width); without it
+    there is one full-width column. Column 0 of the model is used.
+
+    ``create_item(parent)`` builds a pooled widget and ``bind_item(widget,
+    index)`` fills it for a row; keep binding cheap (set text, properties),
+    since it runs for every row scrolled into view. Items keep their
+    binding while visible, so per-item state (hover, focus) survives small
+    scrolls.
+    """
+
+    _RESET_SIGNALS = ("modelReset", "layoutChanged", "rowsInserted", "rowsRemoved", "rowsMoved")
+
+    def __init__(
+        self,
+        create_item: Optional[ItemFactory] = None,
+        bind_item: Optional[ItemBinder] = None,
+        item_height: int = 72,
+        item_width: Optional[int] = None,
+        spacing: int = SPACING.sm,
+        parent: Optional[QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._create_item = create_item or card_item
+        self._bind_item = bind_item or bind_card
+        self._item_height = item_height
+        self._item_width = item_width
+        self._spacing = spacing
+        self._model: Optional[QAbstractItemModel] = None
+        # Pool slot i shows rows congruent to i modulo the pool size
+        self._pool: list[QWidget] = []
+        self._bound: list[int] = []
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(max(1, item_height // 2))
+
+    def model(self) -> Optional[QAbstractItemModel]:
+        return self._model
+
+    def setModel(self, model: Optional[QAbstractItemModel]) -> None:
+        if self._model is not None:
+            for name in self._RESET_SIGNALS:
+                getattr(self._model, name).disconnect(self._reset)
+            self._model.dataChanged.disconnect(self._on_data_changed)
+        self._model = model
+        if model is not None:
+            for name in self._RESET_SIGNALS:
+                getattr(model, name).connect(self._reset)
+            model.dataChanged.connect(self._on_data_changed)
+        self._reset()
+
+    @property
+    def pool_size(self) -> int:
+        """Item widgets created so far (bounded by the viewport size)."""
+        return len(self._pool)
+
+    def columns(self) -> int:
+        if self._item_width is None:
+            return 1
+        usable = self.viewport().width() - self._spacing
+        return max(1, usable // (self._item_width + self._spacing))
+
+    def index_for(self, item: QWidget) -> QModelIndex:
+        """The model index an item widget is currently bound to."""
+        try:
+            row = self._bound[self._pool.index(item)]
+        except ValueError:
+            row = -1
+        if row < 0 or self._model is None:
+            return QModelIndex()
+        return self._model.index(row, 0)
+
+    def scroll_to(self, row: int) -> None:
+        """Scroll so ``row`` is at the top (as far as the range allows)."""
+        line = row // self.columns()
+        self.verticalScrollBar().setValue(line * (self._item_height + self._spacing))
+
+    def _row_count(self) -> int:
+        return self._model.rowCount() if self._model is not None else 0
+
+    def _reset(self, *args) -> None:
+        self._bound = [-1] * len(self._pool)
+        self._update_scroll_range()
+        self._layout_items()
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()) -> None:
+        first, last = top_left.row(), bottom_right.row()
+        for slot, row in enumerate(self._bound):
+            if first <= row <= last:
+                self._bound[slot] = -1
+        self._layout_items()
+
+    def _update_scroll_range(self) -> None:
+        pitch = self._item_height + self._spacing
+        lines = -(-self._row_count() // self.columns())
+        content = lines * pitch + self._spacing
+        height = self.viewport().height()
+        bar = self.verticalScrollBar()
+        bar.setPageStep(height)
+        bar.setRange(0, max(0, content - height))
+
+    def _ensure_pool(self, size: int) -> None:
+        if len(self._pool) >= size:
+            return
+        viewport = self.viewport()
+        while len(self._pool) < size:
+            item = self._create_item(viewport)
+            item.hide()
+            self._pool.append(item)
+        # The row -> slot mapping depends on the pool size
+        self._bound = [-1] * len(self._pool)
+
+    def _layout_items(self) -> None:
+        count = self._row_count()
+        columns = self.columns()
+        spacing, height = self._spacing, self._item_height
+        pitch = height + spacing
+        viewport = self.viewport()
+        top = self.verticalScrollBar().value()
+
+        first_line = max(0, (top - spacing) // pitch)
+        visible_lines = viewport.height() // pitch + 2
+        self._ensure_pool(visible_lines * columns)
+        width = (viewport.width() - (columns + 1) * spacing) // columns
+
+        first = first_line * columns
+        last = min(count, first + visible_lines * columns)
+        size = len(self._pool)
+        used = set()
+        for row in range(first, last):
+            slot = row % size
+            item = self._pool[slot]
+            if self._bound[slot] != row:
+                self._bind_item(item, self._model.index(row, 0))
+                self._bound[slot] = row
+            line, column = divmod(row, columns)
+            item.setGeometry(
+                spacing + column * (width + spacing),
+                spacing + line * pitch - top,
+                width,
+                height,
+            )
+            if item.isHidden():
+                item.show()
+            used.add(slot)
+        for slot, item in enumerate(self._pool):
+            if slot not in used and not item.isHidden():
+                item.hide()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        # Items are repositioned instead of scrolling viewport pixels
+        self._layout_items()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._update_scroll_range()
+        self._layout_items()
@@ -5,7 +5,8 @@ Pre-styled PySide6 widgets matching the design system.
 
 from __future__ import annotations
 
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
 
 try:
     from PySide6.QtWidgets import (
@@ -13,12 +14,15 @@ try:
         QLabel,
         QLineEdit,
         QFrame,
+        QLayout,
         QVBoxLayout,
         QWidget,
-        QGraphicsDropShadowEffect,
     )
-    from PySide6.QtCore import Qt, Signal, Property
-    from PySide6.QtGui import QColor
+    from PySide6.QtCore import Qt, QMargins, QPoint, QTimer, Signal, Property
+    from PySide6.QtGui import QPainter, QPixmap
+    from shiboken6 import isValid
+
+    from rosewood.shadow import CARD_SHADOW, shadow_frame
     HAS_PYSIDE = True
 except ImportError:
     HAS_PYSIDE = False
@@ -27,7 +31,91 @@ except ImportError:
     QLineEdit = object
     QFrame = object
 
-from rosewood.colors import DarkColors, RADIUS, SPACING
+from rosewood.instrument import traced
+from rosewood.theme import Theme
+
+# Polished widgets whose property selectors changed; re-polished together on
+# the next event-loop tick (see _request_polish).
+_pending_polish: dict[int, QWidget] = {}
+
+
+def _request_polish(widget: QWidget) -> None:
+    """Re-polish ``widget`` after a ``class``/``variant`` property change.
+    
+    A widget that has not been polished yet needs nothing: Qt polishes it
+    with its current properties when it is first shown. Changes to polished
+    widgets are coalesced into one re-polish per widget per event-loop tick.
+    """
+    if not widget.testAttribute(Qt.WA_WState_Polished):
+        return
+    if not _pending_polish:
+        QTimer.singleShot(0, _flush_polish)
+    _pending_polish[id(widget)] = widget
+
+
+@traced(name="polish")
+def _flush_polish() -> None:
+    widgets = list(_pending_polish.values())
+    _pending_polish.clear()
+    for widget in widgets:
+        if isValid(widget):
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+
+
+@contextmanager
+def batch(parent: Optional[QWidget] = None) -> Iterator[None]:
+    """Build many widgets under ``parent`` with one layout and update pass.
+    
+    While the block runs, ``parent`` does not repaint and its layout is
+    disabled, and new widgets stay unpolished. On exit the widgets Qt would
+    show lazily (one queued call each) are shown directly, pending
+    re-polishes are flushed, the layout is activated once and ``parent`` is
+    repainted once.
+    
+    Usage:
+        with rosewood.batch(panel):
+            for name in names:
+                panel.layout().addWidget(RwBadge(name))
+    """
+    if parent is None:
+        try:
+            yield
+        finally:
+            _flush_polish()
+        return
+    
+    updates = parent.updatesEnabled()
+    layout = parent.layout()
+    layout_enabled = layout is not None and layout.isEnabled()
+    if updates:
+        parent.setUpdatesEnabled(False)
+    if layout_enabled:
+        layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        if layout is not None and parent.isVisible():
+            _show_managed(layout)
+        _flush_polish()
+        if layout_enabled:
+            layout.setEnabled(True)
+            layout.activate()
+        if updates:
+            parent.setUpdatesEnabled(True)
+
+
+def _show_managed(layout: QLayout) -> None:
+    """Show layout-managed widgets that Qt would otherwise show via a queued call."""
+    for i in range(layout.count()):
+        item = layout.itemAt(i)
+        widget = item.widget()
+        if widget is not None:
+            if widget.isHidden() and not widget.testAttribute(Qt.WA_WState_ExplicitShowHide):
+                widget.setVisible(True)
+        elif item.layout() is not None:
+            _show_managed(item.layout())
 
 
 class RwButton(QPushButton if HAS_PYSIDE else object):
@@ -58,6 +146,7 @@ class RwButton(QPushButton if HAS_PYSIDE else object):
         self._variant = variant
         self._apply_variant()
     
+    @traced
     def _apply_variant(self) -> None:
         """Apply variant-specific styling via property."""
         if self._variant == "primary":
@@ -69,9 +158,7 @@ class RwButton(QPushButton if HAS_PYSIDE else object):
         else:
             self.setProperty("class", "")
         
-        # Force style refresh
-        self.style().unpolish(self)
-        self.style().polish(self)
+        _request_polish(self)
     
     @property
     def variant(self) -> str:
@@ -110,6 +197,7 @@ class RwLabel(QLabel if HAS_PYSIDE else object):
         self._label_style = style
         self._apply_style()
     
+    @traced
     def _apply_style(self) -> None:
         if self._label_style == "secondary":
             self.setProperty("class", "secondary")
@@ -120,8 +208,7 @@ class RwLabel(QLabel if HAS_PYSIDE else object):
         else:
             self.setProperty("class", "")
         
-        self.style().unpolish(self)
-        self.style().polish(self)
+        _request_polish(self)
 
 
 class RwInput(QLineEdit if HAS_PYSIDE else object):
@@ -155,6 +242,12 @@ class RwCard(QFrame if HAS_PYSIDE else object):
         - elevated: With drop shadow
         - interactive: Hover effects
     
+    Elevated cards paint a cached nine-slice shadow (see ``rosewood.shadow``)
+    inside a margin reserved by the stylesheet, instead of using a
+    ``QGraphicsDropShadowEffect``. The surface is part of the same cached
+    frame, so a repaint is one blit; the frame is rebuilt on resize and
+    follows the active ``Theme``.
+    
     Usage:
         card = RwCard()
         layout = QVBoxLayout(card)
@@ -174,45 +267,64 @@ class RwCard(QFrame if HAS_PYSIDE else object):
         
         super().__init__(parent)
         self._variant = variant
+        self._shadow_argb: Optional[int] = None
+        self._surface_argb: Optional[int] = None
+        # Cached shadow + surface pixmap and where it goes (see _build_frame)
+        self._frame: Optional[QPixmap] = None
+        self._frame_at = QPoint()
         self._setup()
     
+    @traced
     def _setup(self) -> None:
-        c = DarkColors
-        r = RADIUS
-        s = SPACING
-        
         self.setFrameStyle(QFrame.StyledPanel)
-        
-        base_style = f"""
-            RwCard {{
-                background: {c.surface};
-                border: 1px solid {c.border_light};
-                border-radius: {r.lg}px;
-                padding: {s.lg}px;
-            }}
-        """
+        # Styled by the RwCard rules in the application sheet (Theme.generate_qss)
+        self.setProperty("variant", self._variant)
         
         if self._variant == "elevated":
-            # Add shadow effect
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(20)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 0, 0, 100))
-            self.setGraphicsEffect(shadow)
-            
-            base_style = f"""
-                RwCard {{
-                    background: {c.surface_elevated};
-                    border: none;
-                    border-radius: {r.lg}px;
-                    padding: {s.lg}px;
-                }}
-            """
+            # Shadow margin is reserved by RwCard[variant="elevated"] in the
+            # sheet, which leaves the background to paintEvent
+            self._shadow_argb = Theme.active().palette.argb("shadow")
+            self._surface_argb = Theme.active().palette.argb("surface_elevated")
+            Theme.subscribe(self._on_theme_changed)
         
         elif self._variant == "interactive":
             self.setCursor(Qt.PointingHandCursor)
-        
-        self.setStyleSheet(base_style)
+    
+    def _on_theme_changed(self, theme: Theme) -> None:
+        if not isValid(self):
+            Theme.unsubscribe(self._on_theme_changed)
+            return
+        if self._shadow_argb is not None:
+            self._shadow_argb = theme.palette.argb("shadow")
+            self._surface_argb = theme.palette.argb("surface_elevated")
+            self._frame = None
+            self.update()
+    
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._frame = None
+    
+    def _build_frame(self) -> QPixmap:
+        box = self.rect().marginsRemoved(QMargins(*CARD_SHADOW.margins))
+        self._frame_at = QPoint(
+            box.x() + CARD_SHADOW.dx - CARD_SHADOW.blur,
+            box.y() + CARD_SHADOW.dy - CARD_SHADOW.blur,
+        )
+        return shadow_frame(
+            CARD_SHADOW, self._shadow_argb, box.width(), box.height(),
+            self.devicePixelRatioF(), fill=self._surface_argb,
+        )
+    
+    def paintEvent(self, event) -> None:
+        if self._shadow_argb is None:
+            super().paintEvent(event)
+            return
+        frame = self._frame
+        if frame is None or frame.devicePixelRatio() != self.devicePixelRatioF():
+            frame = self._frame = self._build_frame()
+        painter = QPainter(self)
+        painter.drawPixmap(self._frame_at, frame)
+        painter.end()
     
     def mousePressEvent(self, event) -> None:
         if self._variant == "interactive":
@@ -249,31 +361,41 @@ class RwBadge(QLabel if HAS_PYSIDE else object):
         self._variant = variant
         self._setup()
     
+    @traced
     def _setup(self) -> None:
-        c = DarkColors
-        r = RADIUS
-        
-        colors_map = {
-            "default": (c.surface, c.text_secondary, c.border_light),
-            "accent": (c.accent_bg, c.accent_text, c.accent_light),
-            "success": (c.success_bg, c.success, "transparent"),
-            "danger": (c.danger_bg, c.danger, "transparent"),
-            "warning": (c.warning_bg, c.warning, "transparent"),
-            "info": (c.info_bg, c.info, "transparent"),
-        }
-        
-        bg, fg, border = colors_map.get(self._variant, colors_map["default"])
+        # Styled by the RwBadge rules in the application sheet (Theme.generate_qss)
+        self.setProperty("variant", self._variant)
+        self.setAlignment(Qt.AlignCenter)
+    
+    @property
+    def variant(self) -> str:
+        return self._variant
+    
+    @variant.setter
+    def variant(self, value: str) -> None:
+        if value != self._variant:
+            self._variant = value
+            self.setProperty("variant", value)
+            _request_polish(self)
+    
+    @classmethod
+    def create_many(
+        cls,
+        texts: Iterable[str],
+        variant: str = "default",
+        parent: Optional[QWidget] = None,
+    ) -> list[RwBadge]:
+        """Create one badge per text in a single ``batch`` on ``parent``.
         
-        self.setStyleSheet(f"""
-            RwBadge {{
-                background: {bg};
-                color: {fg};
-                border: 1px solid {border};
-                border-radius: {r.full}px;
-                padding: 4px 12px;
-                font-size: 12px;
-                font-weight: 600;
-            }}
-        """)
+        Badges are added to ``parent``'s layout when it has one.
         
-        self.setAlignment(Qt.AlignCenter)
+        Usage:
+            tags = RwBadge.create_many(names, variant="accent", parent=panel)
+        """
+        layout = parent.layout() if parent is not None else None
+        with batch(parent):
+            badges = [cls(text, variant, parent) for text in texts]
+            if layout is not None:
+                for badge in badges:
+                    layout.addWidget(badge)
+        return badges
@@ -0,0 +1,31 @@
+"""Shared fixtures for the headless tests."""
+
+from __future__ import annotations
+
+import os
+import time
+
+# Before anything imports Qt or rosewood.theme (which reads the cache dir).
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["ROSEWOOD_CACHE_DIR"] = ""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([])
+    yield app
+    app.setStyleSheet("")
+
+
+def wait_until(app, condition, timeout: float = 5.0) -> None:
+    """Process events until ``condition()`` holds (fails after ``timeout`` s)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("timed out waiting for the event loop")
+        app.processEvents()
+        time.sleep(0.001)
@@ -0,0 +1,74 @@
+"""Worker-thread rendering: run_in_background and Theme.apply_async."""
+
+from __future__ import annotations
+
+import pytest
+from conftest import wait_until
+from shiboken6 import delete
+
+
+def test_run_in_background_delivers_errors(qapp):
+    from rosewood.background import run_in_background
+
+    results = []
+
+    def work():
+        raise ValueError("boom")
+
+    run_in_background(work, lambda result, error: results.append((result, error)))
+    wait_until(qapp, lambda: results)
+
+    result, error = results[0]
+    assert result is None
+    assert isinstance(error, ValueError)
+    assert str(error) == "boom"
+
+
+def test_apply_async_failure_resolves_future(qapp, monkeypatch):
+    from PySide6.QtWidgets import QWidget
+
+    from rosewood import Theme
+
+    def fail(self, include=None):
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(Theme, "generate_qss", fail)
+    widget = QWidget()
+    future = Theme().apply_async(widget)
+    wait_until(qapp, future.done)
+
+    assert isinstance(future.exception(), RuntimeError)
+    assert widget not in Theme._pending
+    delete(widget)
+
+
+def test_apply_async_activates_rendered_colors(qapp):
+    from PySide6.QtWidgets import QWidget
+
+    from rosewood import DarkColors, Theme
+
+    widget = QWidget()
+    theme = Theme()
+    future = theme.apply_async(widget)
+    theme.toggle()  # while the request is in flight
+    wait_until(qapp, future.done)
+
+    assert future.result() == widget.styleSheet()
+    assert Theme.active().colors is DarkColors
+    delete(widget)
+
+
+@pytest.mark.parametrize("scoped", [False, True])
+def test_apply_async_applies_sheet(qapp, scoped):
+    from PySide6.QtWidgets import QWidget
+
+    from rosewood import Theme
+
+    widget = QWidget()
+    theme = Theme()
+    future = theme.apply_async(widget, scoped=scoped)
+    wait_until(qapp, future.done)
+
+    assert widget.styleSheet() == future.result()
+    assert Theme.active() is theme
+    delete(widget)
@@ -0,0 +1,25 @@
+"""``rosewood prebuild-qss``: accent palettes rendered into a cache dir."""
+
+from __future__ import annotations
+
+
+def test_prebuild_qss_writes_accent_palettes(tmp_path, capsys):
+    from rosewood.cli import main
+    from rosewood.qss_store import QssStore
+    from rosewood.theme import Theme, ThemeMode
+
+    assert main(["prebuild-qss", "--accent", "#4a90d9", "--cache-dir", str(tmp_path)]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == len(ThemeMode)
+
+    store = QssStore(tmp_path)
+    for mode in ThemeMode:
+        theme = Theme.from_accent("#4a90d9", mode)
+        assert store.load(mode.value, theme._token_hash()) == theme._render_qss()
+
+
+def test_prebuild_qss_rejects_bad_accent(tmp_path, capsys):
+    from rosewood.cli import main
+
+    assert main(["prebuild-qss", "--accent", "not-a-color", "--cache-dir", str(tmp_path)]) == 1
+    assert "rosewood:" in capsys.readouterr().err
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,30 @@
+"""derive_colors: memoized accent palettes and in-gamut OKLCH conversion."""
+
+from __future__ import annotations
+
+
+def test_derive_colors_is_memoized_per_normalized_seed():
+    from rosewood.colormath import derive_colors
+
+    first = derive_colors("#4A90D9", "light")
+    assert derive_colors("#4a90d9", "light") is first
+    assert derive_colors("#4a90d9", "dark") is not first
+    assert first.accent == "#4a90d9"
+
+
+def test_round_trip_through_oklch():
+    from rosewood.colormath import oklch_to_srgb, srgb_to_oklch
+
+    colors = [(0, 0, 0), (255, 255, 255), (74, 144, 217), (232, 168, 192)]
+    assert oklch_to_srgb(srgb_to_oklch(colors)) == colors
+
+
+def test_out_of_gamut_chroma_is_clipped_keeping_hue():
+    from rosewood.colormath import oklch_to_srgb, srgb_to_oklch
+
+    (rgb,) = oklch_to_srgb([(0.7, 0.5, 250.0)])   # far outside sRGB
+    assert all(0 <= channel <= 255 for channel in rgb)
+    lightness, chroma, hue = srgb_to_oklch([rgb])[0]
+    assert abs(lightness - 0.7) < 0.02
+    assert abs(hue - 250.0) < 3
+    assert chroma < 0.5
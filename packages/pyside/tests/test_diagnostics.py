@@ -0,0 +1,26 @@
+"""diagnostics.snapshot: widget and theme-subscriber counts."""
+
+from __future__ import annotations
+
+from shiboken6 import delete
+
+
+def test_snapshot_counts_subscribers_and_dead_widgets(qapp):
+    from rosewood import diagnostics
+    from rosewood.theme import Theme
+    from rosewood.widgets import RwCard
+
+    before = diagnostics.snapshot()
+    cards = [RwCard("elevated") for _ in range(3)]
+    after = diagnostics.snapshot()
+    key = ("RwCard", "elevated")
+    assert after.widgets[key] - before.widgets.get(key, 0) == 3
+    assert after.theme_subscribers - before.theme_subscribers == 3
+
+    delete(cards[0])
+    change = diagnostics.diff(after, diagnostics.snapshot())
+    assert change.dead_subscribers == 1
+    assert change.theme_subscribers == -1
+    assert all(callable(callback) for callback in Theme.subscribers())
+    for card in cards[1:]:
+        delete(card)
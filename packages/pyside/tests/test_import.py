@@ -0,0 +1,31 @@
+"""Import-time budgets of the headless modules (``benchmarks/bench_import.py``)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+BENCH = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_import.py"
+
+
+def _bench_import():
+    spec = importlib.util.spec_from_file_location("bench_import", BENCH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench_import = _bench_import()
+
+
+@pytest.mark.parametrize("statement", list(bench_import.BUDGETS_US))
+def test_import_stays_within_budget_without_qt(statement):
+    runs = [bench_import.measure(statement) for _ in range(3)]
+    best = min(total for total, _ in runs)
+    loaded = {module for _, modules in runs for module in modules}
+    qt = sorted(m for m in loaded if m.startswith(("PySide6", "shiboken6")))
+
+    assert not qt, f"{statement!r} loaded Qt modules: {', '.join(qt)}"
+    assert best <= bench_import.BUDGETS_US[statement], f"{statement!r} took {best} us"
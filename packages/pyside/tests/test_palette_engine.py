@@ -0,0 +1,40 @@
+"""The palette engine: re-applies keep the engine and reuse one style."""
+
+from __future__ import annotations
+
+from shiboken6 import delete
+
+
+def test_toggle_keeps_palette_engine(qapp):
+    from PySide6.QtWidgets import QTableView
+
+    from rosewood import Theme
+    from rosewood.style import RosewoodStyle
+
+    theme = Theme()
+    view = QTableView()
+    theme.apply(view, engine="palette")
+    dark = view.palette().window().color()
+
+    theme.toggle(view)
+    assert view.styleSheet() == ""
+    assert isinstance(view.style(), RosewoodStyle)
+    assert view.palette().window().color() != dark
+    delete(view)
+
+
+def test_reapplying_palette_reuses_style(qapp):
+    from PySide6.QtWidgets import QTableView
+
+    from rosewood import Theme
+    from rosewood.style import RosewoodStyle
+
+    theme = Theme()
+    view = QTableView()
+    for _ in range(3):
+        theme.apply(view, engine="palette")
+        theme.toggle()
+    styles = view.findChildren(RosewoodStyle)
+    assert len(styles) == 1
+    assert view.style() is styles[0]
+    delete(view)
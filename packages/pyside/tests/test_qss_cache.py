@@ -0,0 +1,45 @@
+"""QssCache: bounded LRU of rendered stylesheets with hit/miss counters."""
+
+from __future__ import annotations
+
+
+def test_cache_counts_hits_and_misses():
+    from rosewood.theme import CacheInfo, QssCache
+
+    cache = QssCache(maxsize=4)
+    renders = []
+
+    def render():
+        renders.append(1)
+        return "sheet"
+
+    assert cache.get("dark", render) == "sheet"
+    assert cache.get("dark", render) == "sheet"
+    assert len(renders) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=4, currsize=1)
+
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=4, currsize=0)
+
+
+def test_cache_evicts_least_recently_used():
+    from rosewood.theme import QssCache
+
+    cache = QssCache(maxsize=2)
+    cache.get("a", lambda: "A")
+    cache.get("b", lambda: "B")
+    cache.get("a", lambda: "stale")   # "a" is now the most recent
+    cache.get("c", lambda: "C")       # evicts "b"
+
+    assert cache.get("a", lambda: "stale") == "A"
+    assert cache.get("b", lambda: "B2") == "B2"
+    assert cache.info().currsize == 2
+
+
+def test_themes_share_the_rendered_sheet():
+    from rosewood.theme import Theme, ThemeMode
+
+    Theme.invalidate_cache()
+    first = Theme(ThemeMode.LIGHT).generate_qss()
+    assert Theme(ThemeMode.LIGHT).generate_qss() is first
+    assert Theme.cache_info().hits == 1
@@ -0,0 +1,50 @@
+"""QssStore: hash-verified stylesheets on disk."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_store_round_trip(tmp_path):
+    from rosewood.qss_store import QssStore
+
+    store = QssStore(tmp_path)
+    path = store.save("dark", "abc123", "QWidget { color: #fff; }")
+
+    assert path.parent == tmp_path
+    assert store.load("dark", "abc123") == "QWidget { color: #fff; }"
+    assert store.load("light", "abc123") is None
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda data: b"",                      # zero-length
+        lambda data: data[: len(data) // 2],   # truncated
+        lambda data: data[:-3] + b"!!!",       # body does not match its hash
+        lambda data: b"garbage" + data,        # bad header
+    ],
+    ids=["empty", "truncated", "corrupt", "bad-header"],
+)
+def test_store_discards_damaged_files(tmp_path, damage):
+    from rosewood.qss_store import QssStore
+
+    store = QssStore(tmp_path)
+    path = store.save("dark", "abc123", "QWidget { color: #fff; }")
+    path.write_bytes(damage(path.read_bytes()))
+
+    assert store.load("dark", "abc123") is None
+    assert not path.exists()
+
+
+def test_read_only_store_keeps_damaged_files(tmp_path):
+    from rosewood.qss_store import QssStore
+
+    path = QssStore(tmp_path).save("dark", "abc123", "QWidget {}")
+    path.write_bytes(b"")
+    store = QssStore(tmp_path, read_only=True)
+
+    assert store.load("dark", "abc123") is None
+    assert path.exists()
+    with pytest.raises(PermissionError):
+        store.save("dark", "abc123", "QWidget {}")
@@ -0,0 +1,38 @@
+"""QSS sections: resolving ``include`` and pruned ``generate_qss``."""
+
+from __future__ import annotations
+
+import pytest
+
+
+def test_resolve_sections_by_name_and_class():
+    from rosewood.theme import QSS_SECTIONS, resolve_sections
+
+    names = resolve_sections({"card"})
+    assert "card" in names
+    assert len(names) < len(QSS_SECTIONS)
+    assert list(names) == [name for name in QSS_SECTIONS if name in names]   # sheet order
+
+    by_class = resolve_sections({"QPushButton", "QAbstractButton", "QWidget"})
+    assert "buttons" in by_class
+    assert "card" not in by_class
+
+
+def test_resolve_sections_rejects_unknown_names():
+    from rosewood.theme import resolve_sections
+
+    with pytest.raises(ValueError):
+        resolve_sections({"no-such-section"})
+
+
+def test_generate_qss_prunes_to_included_sections():
+    from rosewood.theme import QSS_SECTIONS, Theme
+
+    theme = Theme()
+    full = theme.generate_qss()
+    pruned = theme.generate_qss(include={"card"})
+
+    assert "RwCard" in pruned
+    assert "QPushButton" not in pruned
+    assert len(pruned) < len(full)
+    assert theme.generate_qss(include=QSS_SECTIONS) is full
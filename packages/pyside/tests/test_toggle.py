@@ -0,0 +1,82 @@
+"""Incremental Theme.toggle: per-tick restyling of Rosewood-installed sheets."""
+
+from __future__ import annotations
+
+from conftest import wait_until
+from shiboken6 import delete
+
+
+def _windows(count):
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from rosewood import RwButton
+
+    windows = []
+    for _ in range(count):
+        window = QWidget()
+        QVBoxLayout(window).addWidget(RwButton("OK", variant="primary"))
+        window.show()
+        windows.append(window)
+    return windows
+
+
+def test_incremental_toggle_spreads_windows_over_ticks(qapp):
+    from rosewood import Theme
+
+    theme = Theme()
+    windows = _windows(3)
+    for window in windows:
+        theme.apply(window, scoped=True)
+    dark = [window.styleSheet() for window in windows]
+
+    report = theme.toggle(qapp, incremental=True)
+    assert report.restyled and report.steps == 3
+    # Only the first window is restyled before toggle() returns
+    assert windows[0].styleSheet() != dark[0]
+    assert [w.styleSheet() for w in windows[1:]] == dark[1:]
+
+    wait_until(qapp, report.finished.done)
+    assert report.finished.result() >= report.elapsed_ms
+    for window, sheet in zip(windows, dark):
+        assert window.styleSheet() not in ("", sheet)
+        delete(window)
+
+
+def test_newer_toggle_cancels_unfinished_switch(qapp):
+    from rosewood import Theme
+
+    theme = Theme()
+    windows = _windows(2)
+    for window in windows:
+        theme.apply(window)
+
+    first = theme.toggle(qapp, incremental=True)
+    second = theme.toggle(qapp, incremental=True)
+    wait_until(qapp, lambda: first.finished.done() and second.finished.done())
+
+    assert first.finished.cancelled()
+    expected = theme.generate_qss()
+    assert all(window.styleSheet() == expected for window in windows)
+    for window in windows:
+        delete(window)
+
+
+def test_incremental_toggle_leaves_other_themes_windows(qapp):
+    from rosewood import Theme
+    from rosewood.theme import ThemeMode
+
+    tenant = Theme.from_accent("#4a90d9", ThemeMode.LIGHT)
+    theme = Theme()
+    own, other = _windows(2)
+    theme.apply(own)
+    tenant.apply(other)
+    tenant_sheet = other.styleSheet()
+
+    report = theme.toggle(qapp, incremental=True)
+    wait_until(qapp, report.finished.done)
+
+    assert report.steps == 1
+    assert own.styleSheet() == theme.generate_qss()
+    assert other.styleSheet() == tenant_sheet
+    delete(own)
+    delete(other)
@@ -0,0 +1,28 @@
+"""Theme.transition: the crossfaded re-apply keeps how the target was themed."""
+
+from __future__ import annotations
+
+from shiboken6 import delete
+
+
+def test_transition_keeps_scoped_sheet(qapp):
+    from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+    from rosewood import RwButton, Theme
+    from rosewood.theme import widget_classes
+
+    theme = Theme()
+    window = QWidget()
+    QVBoxLayout(window).addWidget(RwButton("OK"))
+    window.show()
+    theme.apply(window, scoped=True)
+
+    theme.toggle()
+    animation = theme.transition(window)
+
+    assert animation is not None
+    assert window.styleSheet() == theme.generate_qss(include=widget_classes(window))
+    assert len(window.styleSheet()) < len(theme.generate_qss())
+    assert Theme._styled[window] == (theme, True)
+    animation.stop()
+    delete(window)
@@ -0,0 +1,82 @@
+"""RwItemDelegate: content-sized columns, Qt painting for styled roles, byte-capped cache."""
+
+from __future__ import annotations
+
+from shiboken6 import delete
+
+
+def _model(rows):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+
+    model = QStandardItemModel(len(rows), 1)
+    for row, text in enumerate(rows):
+        model.setItem(row, 0, QStandardItem(text))
+    return model
+
+
+def test_resize_columns_to_contents_fits_text(qapp):
+    from PySide6.QtWidgets import QTableView
+
+    from rosewood.colors import SPACING
+    from rosewood.views import RwTableView
+
+    model = _model(["short", "a considerably longer cell value", "mid-sized"])
+    view, plain = RwTableView(), QTableView()
+    for table in (view, plain):
+        table.setModel(model)
+        table.resizeColumnsToContents()
+
+    width = view.fontMetrics().horizontalAdvance("a considerably longer cell value")
+    assert view.columnWidth(0) >= width + 2 * SPACING.sm
+    assert abs(view.columnWidth(0) - plain.columnWidth(0)) <= 2 * SPACING.sm
+    delete(view)
+    delete(plain)
+
+
+def test_cells_with_unpainted_roles_fall_back_to_qt(qapp, monkeypatch):
+    from PySide6.QtCore import QModelIndex, Qt
+    from PySide6.QtGui import QColor
+    from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+    from rosewood.colors import SPACING
+    from rosewood.views import RwTableView
+
+    model = _model(["plain", "checked", "red"])
+    model.item(1, 0).setCheckable(True)
+    model.item(1, 0).setCheckState(Qt.Checked)
+    model.item(2, 0).setForeground(QColor("red"))
+    view = RwTableView()
+    view.setModel(model)
+    view.resize(300, 200)
+    delegate = view.delegate
+    styled = []
+
+    def paint(self, painter, option, index):
+        styled.append(index.row())
+
+    monkeypatch.setattr(QStyledItemDelegate, "paint", paint)
+    view.show()
+    qapp.processEvents()
+
+    assert sorted(set(styled)) == [1, 2]
+    option = QStyleOptionViewItem()
+    option.initFrom(view)
+    assert delegate.sizeHint(option, model.index(1, 0)).height() == delegate.row_height
+    assert delegate.sizeHint(option, QModelIndex()).width() == 2 * SPACING.sm
+    delete(view)
+
+
+def test_pixmap_cache_is_bounded_by_bytes():
+    from rosewood.views import _LRU
+
+    cache = _LRU(maxsize=100, maxcost=1000)
+    for key in range(5):
+        cache.store(key, object(), cost=300)
+    assert list(cache) == [2, 3, 4]
+    assert cache.cost == 900
+
+    cache.lookup(2)
+    cache.store(5, object(), cost=300)
+    assert list(cache) == [4, 2, 5]
+    cache.clear()
+    assert cache.cost == 0